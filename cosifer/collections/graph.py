@@ -26,16 +26,27 @@ class Graph(object):
     n = 0
     labels_to_indices = None
     indices_to_labels = None
-
-    def __init__(self, adjacency, labels=None, undirected=True):
+    # NOTE: plain mappings backing the series for fast lookups
+    _labels_to_indices = None
+    _indices_to_labels = None
+    _scaled_adjacency = None
+
+    def __init__(
+        self, adjacency, labels=None, undirected=True, lower_triangular=False
+    ):
         """
         Instantiate a graph.
 
         Args:
-            adjacency (spicy.sparse.csr_matrix): adjacency matrix.
+            adjacency (np.ndarray, pd.DataFrame or scipy sparse matrix):
+                adjacency matrix. Sparse matrices are accepted in any
+                format and converted to CSR.
             labels (iterable, optional): node labels. Defaults to None.
             undirected (bool, optional): flag indicating whether edges are
                 directed. Defaults to True.
+            lower_triangular (bool, optional): flag indicating that a sparse
+                adjacency is already lower triangular and can be stored
+                without filtering. Defaults to False.
 
         Raises:
             RuntimeError: raise an error in case the adjacency type is not
@@ -50,7 +61,9 @@ class Graph(object):
         elif isinstance(adjacency, pd.DataFrame):
             self.set_adjacency_from_pandas(adjacency)
         elif ss.issparse(adjacency):
-            self.set_adjacency_from_sparse(adjacency.tolil())
+            self.set_adjacency_from_sparse(
+                adjacency, lower_triangular=lower_triangular
+            )
         else:
             logger.error('input adjacency type not compatible.')
             raise RuntimeError('input adjacency type not compatible.')
@@ -76,11 +89,10 @@ class Graph(object):
                 'inconsistent when setting labels.'
             )
         # NOTE: fixing labels to be strings to ease their handling
-        labels = [str(label) for label in labels]
-        self.labels_to_indices = pd.Series(
-            {label: index
-             for index, label in enumerate(labels)}
-        )
+        labels = list(map(str, labels))
+        self._labels_to_indices = dict(zip(labels, range(len(labels))))
+        self._indices_to_labels = np.array(labels, dtype=object)
+        self.labels_to_indices = pd.Series(self._labels_to_indices)
         self.indices_to_labels = pd.Series(labels)
 
     def set_adjacency_from_numpy(self, adjacency):
@@ -105,12 +117,13 @@ class Graph(object):
                     'numpy.ndarray are inconsistent.'
                 )
         else:
-            labels = [str(index) for index in range(adjacency.shape[0])]
+            labels = list(map(str, range(n)))
             self.set_labels(labels)
             self.n = n
         if self.undirected:
-            adjacency[np.triu_indices(n)] = 0.0
+            adjacency = np.tril(adjacency, k=-1)
         self.adjacency = SPARSE_MATRIX(adjacency)
+        self._scaled_adjacency = None
         del (adjacency)
 
     def set_adjacency_from_pandas(self, adjacency):
@@ -138,17 +151,22 @@ class Graph(object):
             labels = adjacency.columns
             self.set_labels(labels)
             self.n = n
+        adjacency = adjacency.values
         if self.undirected:
-            adjacency.values[np.triu_indices(n)] = 0.0
-        self.adjacency = SPARSE_MATRIX(adjacency.values)
+            adjacency = np.tril(adjacency, k=-1)
+        self.adjacency = SPARSE_MATRIX(adjacency)
+        self._scaled_adjacency = None
         del (adjacency)
 
-    def set_adjacency_from_sparse(self, adjacency):
+    def set_adjacency_from_sparse(self, adjacency, lower_triangular=False):
         """
         Set the adjacency from a sparse matrix.
 
         Args:
-            adjacency (spicy.sparse.csr_matrix): adjacency matrix.
+            adjacency (scipy.sparse.spmatrix): adjacency matrix in any
+                sparse format.
+            lower_triangular (bool, optional): flag indicating that the
+                adjacency is already lower triangular. Defaults to False.
 
         Raises:
             RuntimeError: in case of inconsitencies in the sizes.
@@ -165,12 +183,22 @@ class Graph(object):
                     'scipy sparse matrix  are inconsistent.'
                 )
         else:
-            labels = [str(index) for index in range(adjacency.shape[0])]
+            labels = list(map(str, range(n)))
             self.set_labels(labels)
             self.n = n
-        if self.undirected:
-            adjacency[np.triu_indices(n)] = 0.0
-        self.adjacency = adjacency.tocsr()
+        if lower_triangular:
+            self.adjacency = adjacency.tocsr()
+        elif self.undirected:
+            # keep only the strictly lower triangular entries
+            coo = adjacency.tocoo()
+            lower = coo.row > coo.col
+            self.adjacency = SPARSE_MATRIX(
+                (coo.data[lower], (coo.row[lower], coo.col[lower])),
+                shape=adjacency.shape
+            )
+        else:
+            self.adjacency = adjacency.tocsr(copy=True)
+        self._scaled_adjacency = None
         del (adjacency)
 
     def __str__(self):
@@ -197,29 +225,53 @@ class Graph(object):
         """
         try:
             a_label, another_label = item
-            return self.adjacency[self.labels_to_indices[a_label], self.
-                                  labels_to_indices[another_label]]
+            return self.adjacency[self._get_index(a_label),
+                                  self._get_index(another_label)]
         except Exception as exc:
             logger.debug('accessing adjacency matrix row.')
             logger.debug(exc)
-            return self.adjacency[self.labels_to_indices[item], :]
+            return self.adjacency[self._get_index(item), :]
+
+    def _get_index(self, label):
+        """
+        Get the index of a label.
+
+        Args:
+            label (object): a label, or labels and positions as supported
+                by labels_to_indices.
+
+        Returns:
+            int or pd.Series: the index of the label.
+        """
+        try:
+            return self._labels_to_indices[label]
+        except (KeyError, TypeError):
+            # NOTE: the series handles positions and lists of labels
+            return self.labels_to_indices[label]
 
     def get_scaled_adjacency(self):
         """
         Get a min-max scaled version of the adjacency.
+        The result is computed once and cached until the adjacency is set
+        again, hence it should not be modified in place.
 
         Returns:
             spicy.sparse.csr_matrix: the min-max scaled adjacency.
         """
-        scaled_graph = np.abs(self.adjacency)
-        # scaling based on non-zero elements
-        min_value, max_value = (
-            scaled_graph.data.min(), scaled_graph.data.max()
+        if self._scaled_adjacency is not None:
+            return self._scaled_adjacency
+        # scaling based on non-zero elements, operating in place on a
+        # single new data buffer and sharing the sparsity structure
+        data = np.abs(self.adjacency.data, dtype=float)
+        min_value, max_value = data.min(), data.max()
+        data -= min_value - EPSILON
+        data /= max_value - min_value + EPSILON
+        self._scaled_adjacency = SPARSE_MATRIX(
+            (data, self.adjacency.indices, self.adjacency.indptr),
+            shape=self.adjacency.shape,
+            copy=False
         )
-        scaled_graph.data = (
-            scaled_graph.data - min_value + EPSILON
-        ) / (max_value - min_value + EPSILON)
-        return scaled_graph
+        return self._scaled_adjacency
 
     def to_interaction_table(self, scaled=True, interaction_symbol='<->'):
         """
@@ -242,36 +294,36 @@ class Graph(object):
         else:
             # graph is not empty
             if scaled:
-                coo = self.get_scaled_adjacency().tocoo()
+                adjacency = self.get_scaled_adjacency()
             else:
-                coo = self.adjacency.tocoo()
-
-            n = coo.nnz
-            labels = np.concatenate(
-                [
-                    self.indices_to_labels[coo.row].values.reshape(n, 1),
-                    self.indices_to_labels[coo.col].values.reshape(n, 1)
-                ],
-                axis=1
+                adjacency = self.adjacency
+            # expand the CSR row pointers instead of converting to COO
+            row = np.repeat(
+                np.arange(adjacency.shape[0], dtype=adjacency.indices.dtype),
+                np.diff(adjacency.indptr)
             )
 
+            labels = self._indices_to_labels
+            e1 = labels.take(row)
+            e2 = labels.take(adjacency.indices)
+
             if self.undirected:
-                labels.sort(axis=1)
+                is_sorted = e1 <= e2
+                e1, e2 = (
+                    np.where(is_sorted, e1, e2), np.where(is_sorted, e2, e1)
+                )
 
+            # NOTE: the index is built by the InteractionTable
             df = pd.DataFrame(
                 {
-                    'e1': labels[:, 0],
-                    'e2': labels[:, 1],
-                    'intensity': coo.data
-                },
-                index=[
-                    '{}{}{}'.format(e1, interaction_symbol, e2)
-                    for e1, e2 in zip(labels[:, 0], labels[:, 1])
-                ]
+                    'e1': e1,
+                    'e2': e2,
+                    'intensity': adjacency.data
+                }
             )
 
         return InteractionTable(
             df=df,
             interaction_symbol=interaction_symbol,
-            labels=list(self.indices_to_labels.values)
+            labels=list(self._indices_to_labels)
         )
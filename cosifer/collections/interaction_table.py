@@ -7,7 +7,6 @@ import scipy.sparse as ss
 logger = logging.getLogger(__name__.split('.')[-1])
 
 interaction_table_columns = {'e1', 'e2', 'intensity'}
-extreme_separator = '@&+*+&@'
 
 
 class InteractionTable(object):
@@ -47,20 +46,21 @@ class InteractionTable(object):
             self.df = df
             if force_undirected:
                 self.df = directed_to_undirected_interactions(self.df)
-            e1 = self.df['e1'].values.tolist()
-            e2 = self.df['e2'].values.tolist()
+            if not labels:
+                labels = sorted(
+                    pd.unique(
+                        np.concatenate(
+                            [self.df['e1'].values, self.df['e2'].values]
+                        )
+                    )
+                )
             if interaction_symbol:
-                self.df.index = [
-                    '{}{}{}'.format(i, interaction_symbol, j)
-                    for i, j in zip(e1, e2)
-                ]
+                self.df.index = self.df['e1'].str.cat(
+                    self.df['e2'].values, sep=interaction_symbol
+                ).values
             self.df = self.df[self.df['intensity'] != 0.]
-            self.labels = (
-                labels
-                if labels else sorted(list(set(e1) | set(e2)))
-            )
             # NOTE: fixing labels to be strings to ease their handling
-            self.labels = [str(label) for label in self.labels]
+            self.labels = list(map(str, labels))
         else:
             logger.error('inconsistent columns in pandas.DataFrame')
             raise RuntimeError('inconsistent columns in pandas.DataFrame')
@@ -94,15 +94,20 @@ class InteractionTable(object):
                 if undirected else imposed_labels
             )
         n = len(labels)
-        labels_to_indices = pd.Series(
-            {label: index
-             for index, label in enumerate(labels)}
-        )
-        row = labels_to_indices[self.df['e1']].values
-        col = labels_to_indices[self.df['e2']].values
+        # hash-based lookup of the positions of the labels
+        labels_to_indices = pd.Index(labels)
+        row = labels_to_indices.get_indexer(self.df['e1'])
+        col = labels_to_indices.get_indexer(self.df['e2'])
+        if (row < 0).any() or (col < 0).any():
+            logger.error('interactions contain labels not in the graph.')
+            raise RuntimeError('interactions contain labels not in the graph.')
         values = self.df['intensity'].values
-        adjacency = ss.coo_matrix((values, (row, col)), shape=(n, n))
-        return Graph(adjacency=adjacency, labels=labels)
+        # build directly the lower triangular CSR stored by the graph
+        lower = row > col
+        adjacency = ss.csr_matrix(
+            (values[lower], (row[lower], col[lower])), shape=(n, n)
+        )
+        return Graph(adjacency=adjacency, labels=labels, lower_triangular=True)
 
     def apply_filter(
         self,
@@ -130,22 +135,27 @@ class InteractionTable(object):
         Returns:
             InteractionTable: a filtered interaction table.
         """
-        df = self.df.copy()
-        df_labels = self.labels.copy()
+        df = self.df
+        df_labels = self.labels
         if indices is not None:
             df = df.loc[indices]
+        # accumulate the row selection in a single boolean mask
+        mask = np.ones(len(df), dtype=bool)
         if labels is not None:
-            selected = [
-                index for index, row in df.iterrows()
-                if row['e1'] in labels and row['e2'] in labels
-            ]
-            df = df.loc[selected]
+            mask &= (df['e1'].isin(labels) & df['e2'].isin(labels)).values
             if prune_labels:
-                df_labels = sorted(list(set(df['e1']) | set(df['e2'])))
+                df_labels = sorted(
+                    pd.unique(
+                        np.concatenate(
+                            [df['e1'].values[mask], df['e2'].values[mask]]
+                        )
+                    )
+                )
         if threshold > 0.0:
-            df = df[df['intensity'] >= threshold]
+            mask &= df['intensity'].values >= threshold
+        df = df[mask]
         if top_n is not None:
-            df = df.sort_values(ascending=False, by='intensity')[:top_n]
+            df = df.nlargest(top_n, 'intensity')
         return InteractionTable(df=df, labels=df_labels)
 
     def get_df_dict(self, threshold=None):
@@ -192,36 +202,6 @@ class InteractionTable(object):
         )
 
 
-def process_index(index, intensity, interaction_symbol):
-    """
-    Process index to get edge tuple. Disregard edge weight.
-
-    Args:
-        index (str): index of the edge list dataframe.
-        intensity (float): intensity of the edge.
-        interaction_symbol (str): symbol used to separate node labels.
-
-    Returns:
-        tuple: a tuple containing edge labels.
-    """
-    return tuple(index.split(interaction_symbol))
-
-
-def process_index_with_weights(index, intensity, interaction_symbol):
-    """
-    Process index to get edge tuple including edge weight.
-
-    Args:
-        index (str): index of the edge list dataframe.
-        intensity (float): intensity of the edge.
-        interaction_symbol (str): symbol used to separate node labels.
-
-    Returns:
-        tuple: a tuple containing edge labels and weight.
-    """
-    return tuple(index.split(interaction_symbol) + [intensity])
-
-
 def interaction_table_to_edge_list(
     interaction_table, interaction_symbol='<->', weights=True
 ):
@@ -238,14 +218,14 @@ def interaction_table_to_edge_list(
     Returns:
         list: a list of edges represented by tuples.
     """
-    process_index_intensity = process_index
+    df = interaction_table.df
+    edges = pd.Series(df.index, dtype=object).str.split(interaction_symbol)
     if weights:
-        process_index_intensity = process_index_with_weights
-    return [
-        process_index_intensity(index, intensity, interaction_symbol)
-        for index, intensity in
-        zip(interaction_table.df.index, interaction_table.df['intensity'])
-    ]
+        return [
+            tuple(labels + [intensity])
+            for labels, intensity in zip(edges, df['intensity'])
+        ]
+    return list(map(tuple, edges))
 
 
 def interaction_table_from_dict(interaction_dictionary):
@@ -303,20 +283,6 @@ def interaction_table_from_gzip(filepath):
     return InteractionTable(df=edge_list_df[['e1', 'e2', 'intensity']])
 
 
-def process_group(row):
-    """
-    Process a grouped edge list dataframe
-
-    Args:
-        row (pd.Series): a dataframe row.
-
-    Returns:
-        list: a list with entitity labels and weight.
-    """
-    splitted_name = row.name.split(extreme_separator)
-    return sorted(splitted_name) + [row[2]]
-
-
 def directed_to_undirected_interactions(directed_interactions):
     """
     Processing of a directed table, discarding directions and keeping only
@@ -330,13 +296,17 @@ def directed_to_undirected_interactions(directed_interactions):
     Returns:
         pd.DataFrame: undirected interactions dataframe
     """
-    columns = directed_interactions.columns.tolist()
-    directed_interactions['order'] = directed_interactions.apply(
-        lambda row: extreme_separator.join(sorted((row[0], row[1]))), axis=1
-    )
-    directed_interactions = directed_interactions.groupby('order').max()
+    e1 = directed_interactions['e1'].values
+    e2 = directed_interactions['e2'].values
+    # order the entities of each interaction lexicographically
+    is_sorted = e1 <= e2
     undirected_interactions = pd.DataFrame(
-        directed_interactions.apply(process_group, axis=1).values.tolist()
+        {
+            'e1': np.where(is_sorted, e1, e2),
+            'e2': np.where(is_sorted, e2, e1),
+            'intensity': directed_interactions['intensity'].values
+        }
     )
-    undirected_interactions.columns = columns
-    return undirected_interactions
+    return undirected_interactions.groupby(
+        ['e1', 'e2'], as_index=False
+    )['intensity'].max()
@@ -1,15 +1,39 @@
 """Combiner for interaction tables."""
 import logging
+import numpy as np
+import pandas as pd
 from .network_combiner import NetworkCombiner
 from .core import concatenate_intensities, combined_df_to_interaction_table
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
+def nan_hard_mean(intensities, axis=1):
+    """
+    Compute the mean of the intensities counting NaNs as zeros, a.k.a.,
+    without considering interaction existence.
+
+    Args:
+        intensities (np.ndarray): intensities.
+        axis (int, optional): axis of the reduction. Defaults to 1.
+
+    Returns:
+        np.ndarray: the hard mean of the intensities.
+    """
+    return np.nansum(intensities, axis=axis) / intensities.shape[axis]
+
+
+# NOTE: NaN-aware reductions applied directly on the array of the
+# concatenated intensities
+NUMPY_REDUCE_FUNCTIONS = {
+    np.nanmean, np.nanmedian, np.nanmax, np.nanmin, nan_hard_mean
+}
+
+
 def combine_tables(
     table_list, interaction_symbol='<->',
     processing_concatenated_intensities_fn=lambda x: x,
-    reduce_fn=lambda x: x.mean(axis=1),
+    reduce_fn=np.nanmean,
     **kwargs
 ):
     """
@@ -23,19 +47,48 @@ def combine_tables(
         processing_concatenated_intensities_fn (function, optional): function
             to apply on the concatenated intensities. Defaults to identity.
         reduce_fn (function, optional): function to reduce intensities over
-            dataframe rows. Defaults to mean.
+            dataframe rows, returning a series. The functions in
+            NUMPY_REDUCE_FUNCTIONS are applied with axis=1 on the underlying
+            numpy array instead. Defaults to np.nanmean.
 
     Returns:
         InteractionTable: the combined interaction table.
     """
+    if len(table_list) == 1 and not kwargs.get('threshold_rate'):
+        # NOTE: a single table needs no concatenation, while its intensities
+        # are still processed and reduced as in a consensus
+        table = table_list[0]
+        intensities = pd.DataFrame(
+            table.df['intensity'].values.astype(float), index=table.df.index
+        )
+        e1, e2 = table.df['e1'].values, table.df['e2'].values
+    else:
+        intensities, e1, e2 = concatenate_intensities(
+            table_list, return_edges=True, **kwargs
+        )
+    original_index = intensities.index
+    intensities = processing_concatenated_intensities_fn(intensities)
+    if reduce_fn in NUMPY_REDUCE_FUNCTIONS:
+        combined = pd.Series(
+            reduce_fn(intensities.values, axis=1), index=intensities.index
+        )
+    else:
+        combined = reduce_fn(intensities)
+    edges = (e1, e2)
+    if not combined.index.equals(original_index):
+        # NOTE: the processing or the reduction dropped or reordered the
+        # interactions, hence the labels are realigned, or obtained from the
+        # index for interactions that were not concatenated
+        positions = original_index.get_indexer(combined.index)
+        edges = (
+            (e1[positions], e2[positions]) if (positions >= 0).all()
+            else None
+        )
     return combined_df_to_interaction_table(
-        combined=reduce_fn(
-            processing_concatenated_intensities_fn(
-                concatenate_intensities(table_list, **kwargs)
-            )
-        ),
+        combined=combined,
         table_list=table_list,
-        interaction_symbol=interaction_symbol
+        interaction_symbol=interaction_symbol,
+        edges=edges
     )
 
 
@@ -49,8 +102,11 @@ def get_scaled_ranks(dataframe):
     Returns:
         pd.DataFrame: scaled ranks dataframe
     """
-    ranks = dataframe.rank()
-    return ranks / ranks.max()
+    ranks = dataframe.rank().values
+    return pd.DataFrame(
+        ranks / np.nanmax(ranks, axis=0),
+        index=dataframe.index, columns=dataframe.columns
+    )
 
 
 def hard_mean_scaled_ranks_table(
@@ -71,7 +127,7 @@ def hard_mean_scaled_ranks_table(
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
         processing_concatenated_intensities_fn=get_scaled_ranks,
-        reduce_fn=lambda x: x.sum(axis=1) / len(table_list)
+        reduce_fn=nan_hard_mean
     )
 
 
@@ -108,7 +164,7 @@ def median_scaled_ranks_table(table_list, interaction_symbol='<->', **kwargs):
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
         processing_concatenated_intensities_fn=get_scaled_ranks,
-        reduce_fn=lambda x: x.median(axis=1)
+        reduce_fn=np.nanmedian
     )
 
 
@@ -127,7 +183,7 @@ def max_scaled_ranks_table(table_list, interaction_symbol='<->', **kwargs):
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
         processing_concatenated_intensities_fn=get_scaled_ranks,
-        reduce_fn=lambda x: x.max(axis=1)
+        reduce_fn=np.nanmax
     )
 
 
@@ -146,7 +202,7 @@ def min_scaled_ranks_table(table_list, interaction_symbol='<->', **kwargs):
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
         processing_concatenated_intensities_fn=get_scaled_ranks,
-        reduce_fn=lambda x: x.min(axis=1)
+        reduce_fn=np.nanmin
     )
 
 
@@ -165,7 +221,7 @@ def hard_mean_table(table_list, interaction_symbol='<->', **kwargs):
     """
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
-        reduce_fn=lambda x: x.sum(axis=1) / len(table_list)
+        reduce_fn=nan_hard_mean
     )
 
 
@@ -200,7 +256,7 @@ def median_table(table_list, interaction_symbol='<->', **kwargs):
     """
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
-        reduce_fn=lambda x: x.median(axis=1)
+        reduce_fn=np.nanmedian
     )
 
 
@@ -218,7 +274,7 @@ def max_table(table_list, interaction_symbol='<->', **kwargs):
     """
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
-        reduce_fn=lambda x: x.max(axis=1)
+        reduce_fn=np.nanmax
     )
 
 
@@ -236,7 +292,7 @@ def min_table(table_list, interaction_symbol='<->', **kwargs):
     """
     return combine_tables(
         table_list, interaction_symbol=interaction_symbol,
-        reduce_fn=lambda x: x.min(axis=1)
+        reduce_fn=np.nanmin
     )
 
 
@@ -289,6 +345,22 @@ class CombineInteractionTables(NetworkCombiner):
         self.graph = combined_table.to_graph()
         logger.debug('Graph computed')
 
+    def get_fingerprint(self, results_list, *args):
+        """
+        Get a fingerprint of a combination, including the combination
+        function.
+
+        Args:
+            results_list (list): a list of InteractionTable objects.
+            args (list): additional objects identifying the combination.
+
+        Returns:
+            str: hexadecimal digest identifying the combination.
+        """
+        return super().get_fingerprint(
+            results_list, self.combine_tables.__name__, *args
+        )
+
     def __str__(self):
         """
         Get the name of the combiner.
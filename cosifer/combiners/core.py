@@ -1,6 +1,7 @@
 """Core combiner utilities."""
 import logging
-from functools import reduce
+from itertools import chain
+import numpy as np
 import pandas as pd
 from ..collections.interaction_table import InteractionTable
 
@@ -8,7 +9,7 @@ logger = logging.getLogger(__name__.split('.')[-1])
 
 
 def combined_df_to_interaction_table(
-    combined, table_list, interaction_symbol='<->'
+    combined, table_list, interaction_symbol='<->', edges=None
 ):
     """
     Transform combined intensities dataframe into an InteractionTable.
@@ -18,20 +19,23 @@ def combined_df_to_interaction_table(
         table_list (list): a list of InteractionTable objects.
         interaction_symbol (str, optional): symbol used to indicate
             interactions in the index of the dataframe. Defaults to '<->'.
+        edges (tuple, optional): arrays of the labels of the interacting
+            nodes, aligned with the combined intensities. Defaults to None,
+            a.k.a., labels are obtained splitting the index.
 
     Returns:
         InteractionTable: an InteractionTable representing the combined
             intensities.
     """
-    e1, e2 = zip(
-        *[
-            tuple(combined_index.split(interaction_symbol))
-            for combined_index in combined.index
-        ]
-    )
-    labels = set(
-        reduce(lambda a, b: a + b, map(lambda e: e.labels, table_list))
-    )
+    if edges is None:
+        # NOTE: partition splits on the literal symbol, while str.split
+        # would treat multi-character symbols as regular expressions
+        interactions = pd.Series(combined.index).str.partition(
+            interaction_symbol
+        )
+        edges = interactions[0].values, interactions[2].values
+    e1, e2 = edges
+    labels = set(chain.from_iterable(table.labels for table in table_list))
     return InteractionTable(
         pd.DataFrame(
             {
@@ -44,7 +48,9 @@ def combined_df_to_interaction_table(
     )
 
 
-def concatenate_intensities(table_list, threshold_rate=None):
+def concatenate_intensities(
+    table_list, threshold_rate=None, return_edges=False
+):
     """
     Concatenate intensities from a list of InteractionTable objects.
 
@@ -52,20 +58,41 @@ def concatenate_intensities(table_list, threshold_rate=None):
         table_list (list): a list of InteractionTable objects.
         threshold_rate (float, optional): threshold rate for the NAs.
             Defaults to None, a.k.a no threshold applied.
+        return_edges (bool, optional): flag to return also the labels of the
+            interacting nodes. Defaults to False.
 
     Returns:
-        InteractionTable: an InteractionTable representing the combined
-            intensities.
+        pd.DataFrame: a dataframe with the intensities of each table as
+            columns, indexed by the union of the interactions. If
+            return_edges is True, a tuple containing the dataframe and
+            the arrays of the labels of the interacting nodes.
     """
+    # union of the interactions in order of appearance
+    index = table_list[0].df.index
+    e1 = [table_list[0].df['e1'].values]
+    e2 = [table_list[0].df['e2'].values]
+    for table in table_list[1:]:
+        is_new = ~table.df.index.isin(index)
+        index = index.append(table.df.index[is_new])
+        if return_edges:
+            e1.append(table.df['e1'].values[is_new])
+            e2.append(table.df['e2'].values[is_new])
+    intensities = np.full((len(index), len(table_list)), np.nan)
+    for column, table in enumerate(table_list):
+        intensities[index.get_indexer(table.df.index), column] = (
+            table.df['intensity'].values
+        )
     if threshold_rate:
-        return pd.concat(
-            (table.df['intensity'] for table in table_list),
-            sort=False,
-            axis=1
-        ).dropna(axis=0, thresh=threshold_rate * len(table_list))
-    else:
-        return pd.concat(
-            (table.df['intensity'] for table in table_list),
-            sort=False,
-            axis=1
+        selected = (
+            np.count_nonzero(~np.isnan(intensities), axis=1) >=
+            threshold_rate * len(table_list)
         )
+        intensities = intensities[selected]
+        index = index[selected]
+    intensities = pd.DataFrame(intensities, index=index)
+    if return_edges:
+        e1, e2 = np.concatenate(e1), np.concatenate(e2)
+        if threshold_rate:
+            e1, e2 = e1[selected], e2[selected]
+        return intensities, e1, e2
+    return intensities
@@ -1,5 +1,9 @@
 """Interface for a network combiner."""
+import os
+import hashlib
 import logging
+import pickle
+import numpy as np
 from ..handlers.network_handler import NetworkHandler
 
 logger = logging.getLogger(__name__.split('.')[-1])
@@ -12,12 +16,25 @@ class NetworkCombiner(NetworkHandler):
     Attributes:
         trained (bool): flag to indicate whether the combiner is
             already trained.
+        cache_directory (str): directory where combined graphs are cached
+            using a fingerprint of the combined interaction tables.
     """
 
+    def __init__(self, cache_directory=None, **kwargs):
+        """
+        Initialize the NetworkCombiner.
+
+        Args:
+            cache_directory (str, optional): directory where combined graphs
+                are cached. Defaults to None, a.k.a., no caching.
+        """
+        self.cache_directory = cache_directory
+        super().__init__(**kwargs)
+
     def combine(self, results_list):
         """
         Apply the combination method. Checking whehter the combiner has been
-        already trained.
+        already trained or whether the combination is already cached.
 
         Args:
             results_list (list): a list of InteractionTable objects.
@@ -25,15 +42,69 @@ class NetworkCombiner(NetworkHandler):
         if self.trained:
             logger.info('{} already trained'.format(self))
         else:
-            logger.info('{} not trained yet. combine.'.format(self))
-            self._combine([
+            results_list = [
                 interaction_table
                 for interaction_table in results_list
                 if not interaction_table.df.empty
-            ])
+            ]
+            cache_filepath = None
+            if self.cache_directory:
+                cache_filepath = os.path.join(
+                    self.cache_directory, '{}-{}.pkl'.format(
+                        self, self.get_fingerprint(results_list)
+                    )
+                )
+            if cache_filepath and os.path.isfile(cache_filepath):
+                logger.info(
+                    '{} loading combination from {}'.format(
+                        self, cache_filepath
+                    )
+                )
+                with open(cache_filepath, 'rb') as fp:
+                    self.graph = pickle.load(fp)
+            else:
+                logger.info('{} not trained yet. combine.'.format(self))
+                self._combine(results_list)
+                if cache_filepath:
+                    os.makedirs(self.cache_directory, exist_ok=True)
+                    with open(cache_filepath, 'wb') as fp:
+                        pickle.dump(self.graph, fp)
             self.trained = True
             self.dump()
 
+    def get_fingerprint(self, results_list, *args):
+        """
+        Get a fingerprint of a combination, based on the combiner, its
+        parameters and the content of the interaction tables.
+
+        Args:
+            results_list (list): a list of InteractionTable objects.
+            args (list): additional objects identifying the combination.
+
+        Returns:
+            str: hexadecimal digest identifying the combination.
+        """
+        fingerprint = hashlib.blake2b(digest_size=16)
+        fingerprint.update(
+            repr(
+                (
+                    type(self).__name__, str(self),
+                    sorted(self.parameters.items())
+                ) + args
+            ).encode()
+        )
+        for interaction_table in results_list:
+            fingerprint.update('\n'.join(interaction_table.labels).encode())
+            fingerprint.update(
+                '\n'.join(map(str, interaction_table.df.index)).encode()
+            )
+            fingerprint.update(
+                np.ascontiguousarray(
+                    interaction_table.df['intensity'].values, dtype=float
+                ).tobytes()
+            )
+        return fingerprint.hexdigest()
+
     def _combine(self, results_list):
         """
         Apply the combination method.
@@ -1,6 +1,7 @@
 """SNF combiner."""
 import logging
-from functools import reduce
+from functools import lru_cache
+from itertools import chain
 import numpy as np
 from rpy2.robjects.packages import importr
 import rpy2.robjects.numpy2ri
@@ -10,7 +11,20 @@ from .network_combiner import NetworkCombiner
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
-def compute_snf(results_list, labels, K=20, T=10, snf=importr('SNFtool')):
+@lru_cache(maxsize=None)
+def get_snftool():
+    """
+    Get the SNFtool rpy2 object, loading it and activating the numpy
+    conversion only on the first call.
+
+    Returns:
+        object: SNF rpy2 object.
+    """
+    rpy2.robjects.numpy2ri.activate()
+    return importr('SNFtool')
+
+
+def compute_snf(results_list, labels, K=20, T=10, snf=None):
     """
     Compute combination via SNF.
 
@@ -20,23 +34,24 @@ def compute_snf(results_list, labels, K=20, T=10, snf=importr('SNFtool')):
         K (int, optional): number of nearest neighbors. Defaults to 20.
         T (int, optional): number of steps in the diffusion process. Defaults
             to 10.
-        snf (object, optional): SNF rpy2 object. Defaults to
-            importr('SNFtool').
+        snf (object, optional): SNF rpy2 object. Defaults to None, a.k.a.,
+            the cached object from get_snftool().
 
     Returns:
         Graph: the combined graph.
     """
-    return Graph(
-        np.array(
-            snf.SNF(
-                [
-                    result_df.to_graph(imposed_labels=labels
-                                       ).adjacency.todense()
-                    for result_df in results_list
-                ], K, T
-            )
+    if snf is None:
+        snf = get_snftool()
+    # NOTE: SNFtool works on dense matrices, hence each sparse adjacency is
+    # written in a slice of a single float64 buffer (R has no single
+    # precision matrices)
+    n = len(labels)
+    adjacencies = np.zeros((len(results_list), n, n))
+    for adjacency, result_df in zip(adjacencies, results_list):
+        result_df.to_graph(imposed_labels=labels).adjacency.toarray(
+            out=adjacency
         )
-    )
+    return Graph(np.asarray(snf.SNF(list(adjacencies), K, T)))
 
 
 class SNF(NetworkCombiner):
@@ -71,18 +86,15 @@ class SNF(NetworkCombiner):
         """
         logger.debug('start combining')
         labels = sorted(
-            list(
-                reduce(
-                    lambda a_set, another_set: a_set | another_set,
-                    [set(result_df.labels) for result_df in results_list]
+            set(
+                chain.from_iterable(
+                    result_df.labels for result_df in results_list
                 )
             ),
             reverse=True
         )
-        rpy2.robjects.numpy2ri.activate()
-        snf = importr('SNFtool')
         self.graph = compute_snf(
-            results_list, labels, snf=snf, **self.parameters
+            results_list, labels, snf=get_snftool(), **self.parameters
         )
         self.graph.set_labels(labels)
         logger.debug('finished combining')
@@ -9,23 +9,31 @@ from .core import concatenate_intensities, combined_df_to_interaction_table
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
-def fill_na_ranks(a_series):
+def get_filled_ranks(dataframe):
     """
-    Fill NA ranks in a pd.Series.
+    Descending ranks with ties broken by order of appearance, computed for
+    each column of an intensity dataframe. NAs are ranked first, in order of
+    appearance, shifting the ranks of the available intensities.
 
     Args:
-        a_series (pd.Series): series to fill.
+        dataframe (pd.DataFrame): intensity dataframe.
 
     Returns:
-        pd.Series: the filled series.
+        np.ndarray: ranks with shape (number of columns, number of rows).
     """
-    a_filled_series = a_series.copy()
-    is_na = pd.isna(a_filled_series)
-    if is_na.sum() > 0:
-        fill_values = np.arange(1, is_na.sum() + 1)
-        a_filled_series += fill_values[-1]
-        a_filled_series[is_na] = fill_values
-    return a_filled_series
+    values = dataframe.values
+    n, k = values.shape
+    # a stable sort gives the 'first' method for ties and keeps NAs,
+    # sorted last, in order of appearance
+    order = np.argsort(-values, axis=0, kind='mergesort')
+    ranks = np.empty((n, k), dtype=int)
+    ranks[order, np.arange(k)] = np.arange(1, n + 1)[:, np.newaxis]
+    is_na = np.isnan(values)
+    # shift in place: available ranks by the number of NAs, NA ranks back
+    # to the top
+    ranks += is_na.sum(axis=0)
+    np.subtract(ranks, n, out=ranks, where=is_na)
+    return ranks.T
 
 
 def summa_scores_table(table_list, interaction_symbol='<->', **kwargs):
@@ -42,10 +50,10 @@ def summa_scores_table(table_list, interaction_symbol='<->', **kwargs):
     """
     if len(table_list) == 1:
         return table_list[0]
-    df = concatenate_intensities(table_list, **kwargs)
-    data = df.rank(ascending=False,
-                   method='first').apply(fill_na_ranks,
-                                         axis=0).values.T.astype(int)
+    df, e1, e2 = concatenate_intensities(
+        table_list, return_edges=True, **kwargs
+    )
+    data = get_filled_ranks(df)
     summa = _summa()
     summa.fit(data)
     scores = summa.get_scores(data)
@@ -55,7 +63,8 @@ def summa_scores_table(table_list, interaction_symbol='<->', **kwargs):
     return combined_df_to_interaction_table(
         combined=combined,
         table_list=table_list,
-        interaction_symbol=interaction_symbol
+        interaction_symbol=interaction_symbol,
+        edges=(e1, e2)
     )
 
 
@@ -103,10 +112,10 @@ class Summa(NetworkCombiner):
             combined_table = results_list[0]
         else:
             logger.debug('Start combining')
-            df = concatenate_intensities(results_list)
-            data = df.rank(ascending=False,
-                           method='first').apply(fill_na_ranks,
-                                                 axis=0).values.T.astype(int)
+            df, e1, e2 = concatenate_intensities(
+                results_list, return_edges=True
+            )
+            data = get_filled_ranks(df)
             self.summa_object.fit(data, tol=self.tol, max_iter=self.max_iter)
             scores = self.summa_object.get_scores(data)
             scores -= scores.min()
@@ -115,7 +124,8 @@ class Summa(NetworkCombiner):
             combined_table = combined_df_to_interaction_table(
                 combined=combined,
                 table_list=results_list,
-                interaction_symbol=self.interaction_symbol
+                interaction_symbol=self.interaction_symbol,
+                edges=(e1, e2)
             )
             logger.debug('Finished combining')
         self.graph = combined_table.to_graph()
@@ -14,6 +14,7 @@ class FileSystemHandler(FileHandler):
         filepath (str): path to the file.
     """
     filepath = None
+    _created_directory = None
 
     def __init__(self, filepath, **kwargs):
         """
@@ -36,9 +37,9 @@ class FileSystemHandler(FileHandler):
             IOBase: the loaded file.
         """
         logger.info('try to read file: {}'.format(self.filepath))
-        if os.path.isfile(self.filepath):
+        try:
             return open(self.filepath, file_type)
-        else:
+        except (FileNotFoundError, IsADirectoryError):
             logger.info('file does not exist')
 
     def dump(self, buffer, file_type='w'):
@@ -51,13 +52,23 @@ class FileSystemHandler(FileHandler):
         """
         logger.info('dump to file {}'.format(self.filepath))
         try:
-            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            self.make_directory()
             with open(self.filepath, file_type) as f:
                 f.write(buffer)
         except Exception as exc:
             logger.info('cannot write to file {}'.format(self.filepath))
             logger.info(str(exc))
 
+    def make_directory(self):
+        """
+        Create the directory containing the file, only if it has not been
+        already created for the current filepath.
+        """
+        directory = os.path.dirname(self.filepath)
+        if directory != self._created_directory:
+            os.makedirs(directory, exist_ok=True)
+            self._created_directory = directory
+
     def exist(self):
         """
         Check whether the file exists.
@@ -7,6 +7,31 @@ from .fs_handler import FileSystemHandler
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.zip': 'zip',
+    '.xz': 'xz'
+}
+GZIP_MAGIC_NUMBER = b'\x1f\x8b'
+
+
+def get_compression(filepath, compression='infer'):
+    """
+    Get the compression type for a CSV file.
+
+    Args:
+        filepath (str): path to the file.
+        compression (str, optional): compression type. Defaults to 'infer',
+            a.k.a., inferred from the file extension.
+
+    Returns:
+        str: compression type, None for uncompressed files.
+    """
+    if compression == 'infer':
+        return COMPRESSION_EXTENSIONS.get(os.path.splitext(filepath)[1])
+    return compression
+
 
 class NetworkHandler(FileSystemHandler):
     """
@@ -17,7 +42,8 @@ class NetworkHandler(FileSystemHandler):
             network.
         trained (bool): flag to indicate whether the inference has been
             performed.
-        filepath (str): path to the file where the graph is stored.
+        filepath (str): path to the file where the graph is stored, as
+            parquet if it has a .parquet extension, otherwise as CSV.
         parameters (dict): parameters for the inferencer.
     """
     graph = None
@@ -40,7 +66,7 @@ class NetworkHandler(FileSystemHandler):
         scaled=True,
         interaction_symbol='<->',
         threshold=None,
-        compression='gzip'
+        compression='infer'
     ):
         """
         Dump graph to the file.
@@ -52,7 +78,11 @@ class NetworkHandler(FileSystemHandler):
                 between labels. Defaults to '<->'.
             threshold (float, optional): threshold to apply to the intensity.
                 Defaults to None.
-            compression (str, optional): compression type. Defaults to 'gzip'.
+            compression (str, optional): compression type for CSV files.
+                Defaults to 'infer', a.k.a., inferred from the file
+                extension. Files with a .parquet extension are written with
+                zstd compression, requiring pyarrow, installed with the
+                parquet extra, e.g., `pip install cosifer[parquet]`.
         """
         if (self.trained and self.filepath and self.graph is not None):
             logger.info('{} dump to file'.format(self))
@@ -61,10 +91,18 @@ class NetworkHandler(FileSystemHandler):
                     scaled=scaled, interaction_symbol=interaction_symbol
                 )
                 try:
-                    os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
-                    interactions.df.to_csv(
-                        self.filepath, compression=compression
-                    )
+                    self.make_directory()
+                    if self.filepath.endswith('.parquet'):
+                        interactions.df.to_parquet(
+                            self.filepath, compression='zstd'
+                        )
+                    else:
+                        interactions.df.to_csv(
+                            self.filepath,
+                            compression=get_compression(
+                                self.filepath, compression
+                            )
+                        )
                     del (interactions)
                 except Exception as exc:
                     logger.info('cannot write file {}'.format(self.filepath))
@@ -75,18 +113,37 @@ class NetworkHandler(FileSystemHandler):
         else:
             logger.warn('network not dumped for {}'.format(self))
 
-    def load(self, compression='gzip'):
+    def load(self, compression='infer'):
         """
         Load graph from the file.
 
+        Files with a .parquet extension are read as parquet, requiring pyarrow
+        (parquet extra), any other file as CSV.
+
         Argd:
-            compression (str, optional): compression type. Defaults to 'gzip'.
+            compression (str, optional): compression type for CSV files.
+                Defaults to 'infer', a.k.a., inferred from the file
+                extension, falling back to gzip for gzipped files without
+                a compression extension.
         """
         logger.info('{} try to load inferred network from file'.format(self))
         if os.path.isfile(self.filepath):
-            inference_results = pd.read_csv(
-                self.filepath, header=0, index_col=0, compression=compression
-            )
+            if self.filepath.endswith('.parquet'):
+                inference_results = pd.read_parquet(self.filepath)
+            else:
+                csv_compression = get_compression(self.filepath, compression)
+                if csv_compression is None and compression == 'infer':
+                    # NOTE: graphs used to be gzipped regardless of the
+                    # file extension
+                    with open(self.filepath, 'rb') as fp:
+                        if fp.read(2) == GZIP_MAGIC_NUMBER:
+                            csv_compression = 'gzip'
+                inference_results = pd.read_csv(
+                    self.filepath,
+                    header=0,
+                    index_col=0,
+                    compression=csv_compression
+                )
             interactions = InteractionTable(df=inference_results)
             self.graph = interactions.to_graph()
             self.trained = True
@@ -21,8 +21,7 @@ INFERENCERS = {
         ),
     'funchisq':
         FunChisq(
-            correction='b-h', confidence_threshold=.05,
-            k_min=3, k_max=5, n_init=10
+            correction='b-h', confidence_threshold=.05, k_min=3, k_max=5
         ),
     'aracne':
         Aracne(estimator='spearman'),
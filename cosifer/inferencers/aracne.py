@@ -3,10 +3,10 @@ import logging
 import pandas as pd
 import numpy as np
 import rpy2.robjects as ro
-from rpy2.robjects import pandas2ri, globalenv, r
-from rpy2.robjects.packages import importr
+from rpy2.robjects import pandas2ri
 from ..collections.graph import Graph
 from .network_inferencer import NetworkInferencer
+from ..utils.conversion import data_frame_to_r_data_frame, get_r_package
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
@@ -45,20 +45,16 @@ class Aracne(NetworkInferencer):
         """
         # activate implicit conversion from pandas to R objects
         pandas2ri.activate()
-        minet = importr('minet')
-        # compute number of bins
-        globalenv['n_bins'] = np.sqrt(len(data.index))
-        globalenv['estimator'] = self.estimator
-        globalenv['disc'] = self.disc
-        # compute mutual information matrix
-        globalenv['data'] = ro.conversion.py2rpy(data)
-        r('''
-        mim <- build.mim(
-            data, estimator=estimator,
-            disc=disc, nbins=n_bins
+        minet = get_r_package('minet')
+        # compute mutual information matrix calling minet directly, without
+        # parsing R code and assigning the global environment
+        mim = minet.build_mim(
+            data_frame_to_r_data_frame(data),
+            estimator=self.estimator,
+            disc=self.disc,
+            # compute number of bins
+            nbins=float(np.sqrt(len(data.index)))
         )
-        ''')
-        mim = globalenv['mim']
         # run Aracne
         weight_matrix = ro.conversion.rpy2py(minet.aracne(mim, eps=0.2))
         weight_matrix = pd.DataFrame(
@@ -1,21 +1,119 @@
 """Correlation inferencer."""
 import logging
 import numpy as np
-import sys
 import scipy.sparse as ss
-from scipy.special import betainc
+from scipy.linalg.blas import dsyrk
+from scipy.special import betainc, betaincinv
 from ..collections.graph import Graph
 from .network_inferencer import NetworkInferencer
 from ..utils.stats import CORRECTIONS_SIGNIFICANCE
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
+EPSILON = np.finfo(float).eps
+CHUNK_SIZE = 1024
+
 correlation_preprocess = {
     'pearson': lambda x: x.values.T,
     'spearman': lambda x: x.rank().values.T
 }
 
 
+def standardize_rows(x):
+    """
+    Center the rows of a matrix and scale them to unit norm, so that their
+    dot products are the Pearson correlation coefficients.
+
+    Args:
+        x (np.ndarray): a matrix with variables as rows and observations as
+            columns.
+
+    Returns:
+        np.ndarray: a standardized copy of the matrix.
+    """
+    x = np.array(x, dtype=float)
+    x -= x.mean(axis=1, keepdims=True)
+    x /= np.sqrt(np.einsum('ij,ij->i', x, x))[:, np.newaxis]
+    return x
+
+
+def correlation_coefficients(x):
+    """
+    Compute the Pearson correlation coefficients between the rows of a
+    matrix. Equivalent to the lower triangle of np.corrcoef, normalizing the
+    rows before a symmetric rank-k product (BLAS syrk) that computes only
+    the lower triangle.
+
+    Args:
+        x (np.ndarray): a matrix with variables as rows and observations as
+            columns.
+
+    Returns:
+        np.ndarray: the correlation coefficients in the lower triangle,
+            including the diagonal, and zeros in the upper triangle.
+    """
+    x = standardize_rows(x)
+    # NOTE: the transposed view is Fortran ordered, avoiding a copy
+    rho = dsyrk(1., x.T, trans=1, lower=1)
+    return np.clip(rho, -1., 1., out=rho)
+
+
+def correlation_candidates(x, p_value_threshold, chunk_size=CHUNK_SIZE):
+    """
+    Compute the Pearson correlation coefficients between the rows of a
+    matrix that have a two-sided p-value not above a threshold. The strictly
+    lower triangle is processed in blocks of rows, hence the full correlation
+    matrix is never allocated and memory scales with the size of a block
+    and the number of candidates.
+
+    Args:
+        x (np.ndarray): a matrix with variables as rows and observations as
+            columns.
+        p_value_threshold (float): threshold on the p-values.
+        chunk_size (int, optional): number of rows processed per block.
+            Defaults to CHUNK_SIZE.
+
+    Returns:
+        tuple: rows, columns, correlation coefficients and p-values of the
+            candidates, sorted by row and column.
+    """
+    x = standardize_rows(x)
+    n = x.shape[0]
+    dof = x.shape[1] - 2
+    # NOTE: the p-value is monotonic in dof / (dof + t^2), hence the
+    # threshold is mapped once on the argument of the incomplete beta
+    cutoff = betaincinv(0.5 * dof, 0.5, min(1., p_value_threshold))
+    rows, columns, correlations, arguments = [], [], [], []
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        block = np.dot(x[start:stop], x[:stop].T)
+        np.clip(block, -1., 1., out=block)
+        block_rows, block_columns = np.nonzero(
+            np.tri(stop - start, stop, k=start - 1, dtype=bool)
+        )
+        rho = block[block_rows, block_columns]
+        del (block)
+        # t statistics computed in place on a single buffer
+        squared = rho * rho
+        argument = np.subtract(1., squared)
+        argument += EPSILON
+        np.divide(dof, argument, out=argument)
+        argument *= squared
+        del (squared)
+        argument += dof
+        np.divide(dof, argument, out=argument)
+        candidates = ~(argument > cutoff)
+        rows.append(block_rows[candidates] + start)
+        columns.append(block_columns[candidates])
+        correlations.append(rho[candidates])
+        arguments.append(argument[candidates])
+    p_values = betainc(0.5 * dof, 0.5, np.concatenate(arguments))
+    return (
+        np.concatenate(rows), np.concatenate(columns),
+        np.concatenate(correlations), p_values
+    )
+
+
 class Correlation(NetworkInferencer):
     """
     Correlation inferencer.
@@ -60,25 +158,38 @@ class Correlation(NetworkInferencer):
         entities = data.columns
         # compute correlations
         pre_processed = correlation_preprocess[self.method](data)
-        rho = np.corrcoef(pre_processed)
-        n = rho.shape[0]
-        logger.debug('computed correlation')
-        # compute corrections mask
+        n = pre_processed.shape[0]
         if self.correction in CORRECTIONS_SIGNIFICANCE:
-            triu_indices = np.triu_indices(n, 1)
-            rhof = rho[triu_indices]
-            dof = pre_processed.shape[1] - 2
-            ts = rhof * rhof * (
-                dof / (1 - rhof * rhof + sys.float_info.epsilon)
+            # NOTE: the corrections never select p-values above the
+            # confidence threshold, hence only pairs with p-values below
+            # twice the threshold are kept and the others are accounted
+            # for in the number of tests as p-values equal to one
+            rows, columns, rho, p_values = correlation_candidates(
+                pre_processed, 2 * self.confidence_threshold
+            )
+            logger.debug('computed correlation')
+            significants = CORRECTIONS_SIGNIFICANCE[self.correction](
+                p_values, self.confidence_threshold,
+                number_of_tests=n * (n - 1) // 2
+            )
+            del (p_values)
+            # the graph stores only the lower triangle
+            adjacency = ss.csr_matrix(
+                (
+                    rho[significants],
+                    (rows[significants], columns[significants])
+                ),
+                shape=(n, n)
+            )
+            self.graph = Graph(
+                adjacency=adjacency,
+                labels=entities.values,
+                lower_triangular=True
             )
-            pf = betainc(0.5 * dof, 0.5, dof / (dof + ts))
-            significants = CORRECTIONS_SIGNIFICANCE[
-                self.correction](pf, self.confidence_threshold)
-            mask = ss.lil_matrix(rho.shape, dtype=np.int8)
-            mask[triu_indices] = significants
-            mask += (mask.T + ss.eye(n, dtype=np.uint8))
-            rho = mask.multiply(rho)
-        self.graph = Graph(adjacency=rho, labels=entities.values)
+        else:
+            rho = correlation_coefficients(pre_processed)
+            logger.debug('computed correlation')
+            self.graph = Graph(adjacency=rho, labels=entities.values)
         logger.debug('inferred with {} correlation'.format(self.method))
 
     def __str__(self):
@@ -4,9 +4,9 @@ import pandas as pd
 import numpy as np
 import rpy2.robjects as ro
 from rpy2.robjects import pandas2ri
-from rpy2.robjects.packages import importr
 from ..collections.interaction_table import InteractionTable
 from .network_inferencer import NetworkInferencer
+from ..utils.conversion import get_r_package
 from ..utils.stats import CORRECTIONS
 from ..utils.vector_quantization import k_means_vector_quantization
 
@@ -25,6 +25,7 @@ class FunChisq(NetworkInferencer):
         correction (str): correction method.
         confidence_threshold (float): confidence threshold.
         undirected (bool): flag to indicate an undirected network.
+        quantization (str): quantization method.
     """
 
     def __init__(
@@ -36,6 +37,7 @@ class FunChisq(NetworkInferencer):
         correction=None,
         confidence_threshold=.05,
         undirected=True,
+        quantization='dynamic_programming',
         **kwargs
     ):
         """
@@ -54,6 +56,9 @@ class FunChisq(NetworkInferencer):
                 Defaults to .05.
             undirected (bool, optional): flag to indicate an undirected
                 network. Defaults to True.
+            quantization (str, optional): quantization method, see
+                k_means_vector_quantization. Defaults to
+                'dynamic_programming', a.k.a., exact one dimensional K-means.
         """
         self.k_min = k_min
         self.k_max = k_max
@@ -62,6 +67,7 @@ class FunChisq(NetworkInferencer):
         self.correction = correction
         self.confidence_threshold = confidence_threshold
         self.undirected = undirected
+        self.quantization = quantization
         super().__init__(**kwargs)
 
     def _infer_network(self, data):
@@ -78,6 +84,7 @@ class FunChisq(NetworkInferencer):
                 k_min=self.k_min,
                 k_max=self.k_max,
                 k_step=self.k_step,
+                method=self.quantization,
                 **self.parameters
             ),
             axis=0
@@ -86,41 +93,16 @@ class FunChisq(NetworkInferencer):
         number_of_entities = len(entities)
         # activate implicit conversion from pandas to R objects
         pandas2ri.activate()
-        fun_chisq = importr('FunChisq')
-        # preparing variables to pass to FunChisq
-        independent_variables = None
-        dependent_variables = np.array([], dtype=int)
-        ne_range = range(1, number_of_entities + 1)
-        for index, entity in enumerate(entities):
-            r_index = index + 1
-            dependent_variables = np.hstack(
-                [
-                    dependent_variables,
-                    np.array(
-                        list(
-                            filter(
-                                lambda e_index: e_index != r_index, ne_range
-                            )
-                        )
-                    )
-                ]
-            )
-            if independent_variables is None:
-                independent_variables = np.vstack(
-                    [np.array(r_index) for _ in range(number_of_entities - 1)]
-                )
-            else:
-                independent_variables = np.vstack(
-                    [
-                        independent_variables,
-                        np.vstack(
-                            [
-                                np.array(r_index)
-                                for _ in range(number_of_entities - 1)
-                            ]
-                        )
-                    ]
-                )
+        fun_chisq = get_r_package('FunChisq')
+        # preparing variables to pass to FunChisq: all the ordered pairs of
+        # distinct entities using R indexing
+        r_indices = np.arange(1, number_of_entities + 1)
+        independent_variables, dependent_variables = np.meshgrid(
+            r_indices, r_indices, indexing='ij'
+        )
+        distinct = independent_variables != dependent_variables
+        independent_variables = independent_variables[distinct].reshape(-1, 1)
+        dependent_variables = dependent_variables[distinct]
         # running FunChisq
         interactions = ro.conversion.rpy2py(
             fun_chisq.test_interactions(
@@ -140,19 +122,17 @@ class FunChisq(NetworkInferencer):
         # if undirected keep only interaction with higher importance if
         # both directions are significant
         if self.undirected is True:
-            interactions = interactions.apply(
-                lambda row: pd.Series(sort_interaction_entities(row)), axis=1
+            # sort the entities of each interaction in lexicographic order
+            gene1 = interactions['gene1'].values
+            gene2 = interactions['gene2'].values
+            is_sorted = gene1 <= gene2
+            interactions = interactions.assign(
+                gene1=np.where(is_sorted, gene1, gene2),
+                gene2=np.where(is_sorted, gene2, gene1)
             )
-            interactions.columns = [
-                'gene1', 'gene2', 'p-value', 'statistic', 'estimate'
-            ]
-            interactions['grouping'] = [
-                '{}_{}'.format(*sorted(pair))
-                for pair in zip(interactions['gene1'], interactions['gene2'])
-            ]
             selected_interactions = interactions.groupby(
-                ['grouping']
-            )['p-value'].transform(min) == interactions['p-value']
+                ['gene1', 'gene2']
+            )['p-value'].transform('min') == interactions['p-value']
             interactions = interactions[selected_interactions]
         # prepare the interactions
         interactions = interactions[['gene1', 'gene2', 'statistic']]
@@ -169,18 +149,3 @@ class FunChisq(NetworkInferencer):
             str: name of the inferencer: funchisq.
         """
         return 'funchisq'
-
-
-def sort_interaction_entities(row):
-    """
-    Sort the entities over a row in lexicographic order.
-
-    Args:
-        row (pd.Series): row containing the entities to be sorted.
-
-    Returns:
-        list: a list containing the sorted entities and the rest of the
-            elements of the row unchanged.
-    """
-    sorted_entities = sorted([row['gene1'], row['gene2']])
-    return sorted_entities + list(row[2:])
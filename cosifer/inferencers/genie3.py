@@ -3,14 +3,12 @@ import logging
 
 import pandas as pd
 from rpy2.rinterface import NULL
-from rpy2.rinterface import baseenv as baseenv_ri
 from rpy2.robjects import pandas2ri
-from rpy2.robjects.packages import importr
 
 from ..collections.graph import Graph
 from .network_inferencer import NetworkInferencer
+from ..utils.conversion import data_frame_to_r_matrix, get_r_package
 
-as_matrix = baseenv_ri['as.matrix']
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
@@ -59,13 +57,12 @@ class GENIE3(NetworkInferencer):
         """
         # activate implicit conversion from pandas to R objects
         pandas2ri.activate()
-        genie3 = importr('GENIE3')
-        importr('foreach')
-        importr('doParallel')
-        # transform pandas dataframe into GENIE3 input format
-        # via first automatic conversion to data.frame from pd.DataFrame
-        # to matrix with `as.matrix` to preserve colnames and rownames
-        expr_matrix = as_matrix(pandas2ri.py2rpy(data.T))
+        genie3 = get_r_package('GENIE3')
+        get_r_package('foreach')
+        get_r_package('doParallel')
+        # transform pandas dataframe into GENIE3 input format, a matrix
+        # with colnames and rownames
+        expr_matrix = data_frame_to_r_matrix(data.T)
         # run GENIE3
         values = genie3.GENIE3(
                 expr_matrix, self.regulators, self.targets, self.tree_method,
@@ -1,11 +1,12 @@
 """JRF inferencer."""
 import logging
 import numpy as np
+import pandas as pd
 import rpy2.robjects as ro
 from rpy2.robjects import pandas2ri
-from rpy2.robjects.packages import importr
 from ..collections.interaction_table import InteractionTable
 from .network_inferencer import NetworkInferencer
+from ..utils.conversion import get_r_package
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
@@ -73,7 +74,7 @@ class JointRandomForest(NetworkInferencer):
         number_of_predictors = len(entities) - 1
         # activate implicit conversion from pandas to R objects
         pandas2ri.activate()
-        jrf = importr('JRF')
+        jrf = get_r_package('JRF')
         if self.mtry and self.mtry > number_of_predictors:
             logger.error(
                 "mtry={} > candidate predictors={}.".format(
@@ -103,7 +104,7 @@ class JointRandomForest(NetworkInferencer):
         number_of_predictors = len(entities) - 1
         # activate implicit conversion from pandas to R objects
         pandas2ri.activate()
-        jrf = importr('JRF')
+        jrf = get_r_package('JRF')
         if self.mtry and self.mtry > number_of_predictors:
             logger.error(
                 "mtry={} > candidate predictors={}.".format(
@@ -118,15 +119,21 @@ class JointRandomForest(NetworkInferencer):
                 entities
             )
         )
-        importance_columns = (
-            interactions.columns[
-                interactions.columns.str.startswith('importance')]
+        is_importance = interactions.columns.str.startswith('importance')
+        logger.debug(interactions.columns[is_importance])
+        # NOTE: the importances are averaged on a single numpy block and the
+        # table is built directly, without adding and dropping columns
+        e1, e2 = interactions.columns[~is_importance]
+        interactions = pd.DataFrame(
+            {
+                'e1': interactions[e1].values,
+                'e2': interactions[e2].values,
+                'intensity': np.nanmean(
+                    interactions.loc[:, is_importance].values, axis=1
+                )
+            },
+            columns=['e1', 'e2', 'intensity']
         )
-        logger.debug(importance_columns)
-        interactions['merged_importance'] = interactions[importance_columns
-                                                         ].mean(axis=1)
-        interactions = interactions.drop(importance_columns, axis=1)
-        interactions.columns = ['e1', 'e2', 'intensity']
         self.graph = InteractionTable(df=interactions).to_graph()
         logger.debug('inferred with {}'.format(self.method))
 
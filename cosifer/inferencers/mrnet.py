@@ -4,9 +4,9 @@ import pandas as pd
 import numpy as np
 import rpy2.robjects as ro
 from rpy2.robjects import pandas2ri
-from rpy2.robjects.packages import importr
 from ..collections.graph import Graph
 from .network_inferencer import NetworkInferencer
+from ..utils.conversion import data_frame_to_r_data_frame, get_r_package
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
@@ -46,13 +46,13 @@ class MRNET(NetworkInferencer):
         """
         # activate implicit conversion from pandas to R objects
         pandas2ri.activate()
-        minet = importr('minet')
+        minet = get_r_package('minet')
         # compute number of bins
         self.n_bins = np.sqrt(len(data.index))
         # run MRNET
         weight_matrix = ro.conversion.rpy2py(
             minet.minet(
-                ro.conversion.py2rpy(data),
+                data_frame_to_r_data_frame(data),
                 method='mrnet',
                 estimator=self.estimator,
                 disc=self.disc,
@@ -1,9 +1,16 @@
 """NetworkInferencer abstract interface."""
+import re
+import inspect
+import hashlib
 import logging
+import numpy as np
 from ..handlers.network_handler import NetworkHandler
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
+# NOTE: memory addresses in representations, e.g., of R objects
+MEMORY_ADDRESS_REGEX = re.compile(r' at 0x[0-9a-fA-F]+')
+
 
 class NetworkInferencer(NetworkHandler):
     """
@@ -37,6 +44,54 @@ class NetworkInferencer(NetworkHandler):
             self.trained = True
             self.dump()
 
+    def get_hyperparameters(self):
+        """
+        Get the hyperparameters of the inferencer: the arguments of its
+        constructor and the additional parameters.
+
+        Returns:
+            dict: hyperparameters keyed by name.
+        """
+        hyperparameters = dict(
+            (name, getattr(self, name))
+            for name, parameter in
+            inspect.signature(type(self).__init__).parameters.items()
+            if parameter.kind == parameter.POSITIONAL_OR_KEYWORD and
+            name not in {'self', 'filepath'} and hasattr(self, name)
+        )
+        hyperparameters.update(self.parameters)
+        return hyperparameters
+
+    def get_fingerprint(self, data):
+        """
+        Get a fingerprint of an inference, based on the inferencer, its
+        hyperparameters and the content of the data.
+
+        Args:
+            data (pd.DataFrame): data to be used for the inference.
+
+        Returns:
+            str: hexadecimal digest identifying the inference.
+        """
+        fingerprint = hashlib.blake2b(digest_size=8)
+        fingerprint.update(
+            MEMORY_ADDRESS_REGEX.sub(
+                '',
+                repr(
+                    (
+                        type(self).__name__, str(self),
+                        sorted(self.get_hyperparameters().items())
+                    )
+                )
+            ).encode()
+        )
+        fingerprint.update('\n'.join(map(str, data.index)).encode())
+        fingerprint.update('\n'.join(map(str, data.columns)).encode())
+        fingerprint.update(
+            np.ascontiguousarray(data.values, dtype=float).tobytes()
+        )
+        return fingerprint.hexdigest()
+
     def _infer_network(self, data):
         """
         Infer the network.
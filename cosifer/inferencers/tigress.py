@@ -1,16 +1,132 @@
 """TIGRESS inferencer."""
 import logging
 import numpy as np
-import rpy2.robjects as ro
-from rpy2.robjects import pandas2ri, r, globalenv
-from rpy2.robjects.packages import importr
-from rpy2.rinterface import NULL
+import pandas as pd
+from joblib import Parallel, delayed, parallel_backend
+from sklearn.linear_model import lars_path
 from ..collections.interaction_table import InteractionTable
 from .network_inferencer import NetworkInferencer
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
+def lars_selection(x, y, n_steps_lars):
+    """
+    Select the predictors along the first steps of the LASSO path computed
+    with LARS, fitting an intercept and without normalization.
+
+    Args:
+        x (np.ndarray): predictors, with samples on the rows.
+        y (np.ndarray): response.
+        n_steps_lars (int): number of LARS steps.
+
+    Returns:
+        np.ndarray: a boolean matrix indicating for each step (rows) the
+            selected predictors (columns). The path can end before the
+            requested number of steps.
+    """
+    x = x - x.mean(axis=0)
+    y = y - y.mean()
+    _, _, coefficients = lars_path(
+        x, y, max_iter=n_steps_lars, method='lasso'
+    )
+    return (coefficients[:, 1:] != 0).T
+
+
+def accumulate_selection(counts, selected):
+    """
+    Count in place the selections along a LASSO path.
+
+    Args:
+        counts (np.ndarray): selection counts with steps on the rows and
+            predictors on the columns.
+        selected (np.ndarray): selected predictors per step, as returned by
+            lars_selection.
+    """
+    steps = selected.shape[0]
+    counts[:steps] += selected
+    # NOTE: a path that ends before the requested steps keeps its last
+    # active set for the remaining ones
+    if 0 < steps < counts.shape[0]:
+        counts[steps:] += selected[-1]
+
+
+def stability_selection(
+    x, y, n_bootstrap, n_steps_lars, alpha, scoring, random_state
+):
+    """
+    Stability selection in the spirit of Meinshausen & Buhlman, following
+    the TIGRESS implementation by Anne-Claire Haury and Jean-Philippe Vert.
+
+    Args:
+        x (np.ndarray): predictors, with samples on the rows.
+        y (np.ndarray): response.
+        n_bootstrap (int): number of bootstrap samples, each one fitting
+            a model on both halves of a random split.
+        n_steps_lars (int): number of LARS steps.
+        alpha (float): lower bound of the random predictors reweighting.
+        scoring (str): scoring criterion, 'area' or 'max'.
+        random_state (np.random.RandomState): random state.
+
+    Returns:
+        np.ndarray: the stability scores of the predictors.
+    """
+    n, p = x.shape
+    half_size = n // 2
+    counts = np.zeros((n_steps_lars, p), dtype=int)
+    # a single buffer for the reweighted predictors
+    xs = np.empty_like(x, dtype=float)
+    for _ in range(n_bootstrap):
+        # randomly reweight each variable
+        np.multiply(x, random_state.uniform(alpha, 1., p), out=xs)
+        # randomly split the samples in two sets
+        permutation = random_state.permutation(n)
+        for indices in (permutation[:half_size], permutation[half_size:]):
+            # run LARS on each half and check which variables are selected
+            accumulate_selection(
+                counts, lars_selection(xs[indices], y[indices], n_steps_lars)
+            )
+    # normalize frequencies in [0, 1] to get the stability curves
+    frequencies = counts / (2 * n_bootstrap)
+    # NOTE: the score at the last step is the normalized area under the
+    # stability curve or its maximum
+    if scoring == 'area':
+        return frequencies.mean(axis=0)
+    else:
+        return frequencies.max(axis=0)
+
+
+def stability_scores(
+    x, targets, tf_indices, seeds, n_bootstrap, n_steps_lars, alpha, scoring
+):
+    """
+    Score the regulators of a batch of target genes.
+
+    Args:
+        x (np.ndarray): expression data, with samples on the rows.
+        targets (np.ndarray): indices of the target genes.
+        tf_indices (np.ndarray): indices of the transcription factors.
+        seeds (np.ndarray): seeds of the random states, one per target.
+        n_bootstrap (int): number of bootstrap samples.
+        n_steps_lars (int): number of LARS steps.
+        alpha (float): lower bound of the random predictors reweighting.
+        scoring (str): scoring criterion.
+
+    Returns:
+        np.ndarray: scores with the targets on the rows and the
+            transcription factors on the columns.
+    """
+    scores = np.zeros((len(targets), len(tf_indices)))
+    for row, (target, seed) in enumerate(zip(targets, seeds)):
+        # all the transcription factors except the target
+        predictors = tf_indices != target
+        scores[row, predictors] = stability_selection(
+            x[:, tf_indices[predictors]], x[:, target], n_bootstrap,
+            n_steps_lars, alpha, scoring, np.random.RandomState(seed)
+        )
+    return scores
+
+
 class TIGRESS(NetworkInferencer):
     """
     TIGRESS inferencer.
@@ -29,7 +145,7 @@ class TIGRESS(NetworkInferencer):
     """
     def __init__(
         self,
-        tf_list=NULL,
+        tf_list=None,
         k=-1,
         alpha=0.2,
         n_steps_lars=5,
@@ -45,8 +161,9 @@ class TIGRESS(NetworkInferencer):
         Initialize TIGRESS inferencer.
 
         Args:
-            tf_list (object, optional): list of transcription factor.
-                Defaults to NULL.
+            tf_list (object, optional): list of transcription factor or
+                path to a file containing them. Defaults to None, a.k.a.,
+                all genes.
             k (int, optional): number of edges to return. Defaults to -1.
             alpha (float, optional): alpha parameter. Defaults to 0.2.
             n_steps_lars (int, optional): number of LARS steps. Defaults to 5.
@@ -72,6 +189,30 @@ class TIGRESS(NetworkInferencer):
         self.method = method
         super().__init__(**kwargs)
 
+    def _get_tf_list(self, genes):
+        """
+        Get the transcription factors.
+
+        Args:
+            genes (pd.Index): gene names.
+
+        Returns:
+            np.ndarray: the transcription factors.
+        """
+        if self.tf_list is None:
+            # no transcription factors provided, we take all genes
+            return genes.values
+        elif isinstance(self.tf_list, str) and self.tf_list not in genes:
+            # a single string which is not a gene should be a file
+            return pd.read_csv(
+                self.tf_list, header=None, sep=r'\s+'
+            )[0].astype(str).values
+        else:
+            return np.array(
+                [self.tf_list] if isinstance(self.tf_list, str)
+                else list(self.tf_list)
+            )
+
     def _infer_network(self, data):
         """
         Infer the network.
@@ -79,118 +220,56 @@ class TIGRESS(NetworkInferencer):
         Args:
             data (pd.DataFrame): data to be used for the inference.
         """
-        # activate implicit conversion from pandas to R objects
-        pandas2ri.activate()
-        importr('lars')
-        importr('parallel')
-        # stability selection in the spirit of Meinshausen & Buhlman
-        # authors: Anne-Claire Haury and Jean-Philippe Vert
-        r('''
-        stabilityselection <- function(x, y, nbootstrap=100, nstepsLARS=20, alpha=0.2, scoring="area")
-        {
-            n <- nrow(x)
-            p <- ncol(x)
-            halfsize <- as.integer(n / 2)
-            freq <- matrix(0, nstepsLARS, p)
-
-            for (i in seq(nbootstrap)) {
-                # Randomly reweight each variable
-                        xs <- t(t(x) * runif(p, alpha, 1))
-
-            # Ramdomly split the sample in two sets
-            perm <- sample(n)
-            i1 <- perm[1:halfsize]
-            i2 <- perm[(halfsize + 1):n]
-
-            # run LARS on each randomized, sample and check which variables are selected
-            r <- lars(xs[i1,], y[i1], max.steps = nstepsLARS, normalize = FALSE, trace = FALSE, use.Gram = FALSE)
-            freq <-freq + abs(sign(r$beta[2:(nstepsLARS + 1), ]))
-            r <- lars(xs[i2,], y[i2], max.steps = nstepsLARS, normalize = FALSE, trace = FALSE, use.Gram = FALSE)
-            freq <-freq + abs(sign(r$beta[2:(nstepsLARS + 1), ]))
-        }
-        # normalize frequence in [0,1] to get the stability curves
-        freq <- freq / (2 * nbootstrap)
-        # Compute normalized area under the stability curve
-        if (scoring == "area")
-        score <- apply(freq, 2, cumsum) / seq(nstepsLARS)
-        else
-        score <- apply(freq, 2, cummax)
-
-        invisible(score)
-        }
-        tigress <- function(expdata, tflist=NULL, K=-1 , alpha=0.2, nstepsLARS=5, nbootstrap=100, scoring="area", verb=FALSE, useparallel=TRUE, n_cores=4)
-        {
-            # Gene names
-            genenames <- colnames(expdata)
-            ngenes <- length(genenames)
-            # If needed, load TF list
-            if (is.null(tflist)) {
-                # No TF list or file provided, we take all genes as TF
-                tflist <- genenames
-            } else if (length(tflist) == 1 && is.na(match(tflist, genenames))) {
-                # If this is a single string which is not a gene name, then it should be a file name
-                tflist <- read.table(tflist, header=0)
-                tflist <- as.matrix(tflist)[,1]
-            }
-            # Make sure there are no more steps than variables
-            if (nstepsLARS>length(tflist)-1){
-                nstepsLARS<-length(tflist)-1
-                if (nstepsLARS==0){cat('Too few transcription factors! \n', stderr())}
-                if (verb){
-                cat(paste('Variable nstepsLARS was changed to: ', nstepsLARS, '\n')) }}
-            # Locate TF in gene list by matching their names
-            ntf <- length(tflist)
-            tfindices <- match(tflist,genenames)
-            if (max(is.na(tfindices))) {
-                stop('Error: Could not find all TF in the gene list!')
-            }
-            # Number of predictions to return
-            Kmax <- ntf * ngenes
-            if (K==-1) K <- Kmax
-            K <- min(K, Kmax)
-            # Prepare scoring matrix
-            scorestokeep <- 1
-            score <- list()
-            # A small function to score the regulators of a single gene
-            stabselonegene <- function(itarget) {
-                if (verb) {
-                    cat('.')
-                    }
-                # Name of the target gene
-                targetname <- genenames[itarget]
-                # Find the TF to be used for prediction (all TF except the target if the target is itself a TF)
-                predTF <- tfindices[!match(tflist, targetname, nomatch=0)]
-                r <- stabilityselection(as.matrix(expdata[, predTF]), as.matrix(expdata[, itarget]), nbootstrap=nbootstrap, nsteps=nstepsLARS, alpha=alpha)
-                sc <- array(0, dim=c(ntf, scorestokeep), dimnames = list(tflist, seq(scorestokeep)))
-                sc[predTF,] <- t(r[nstepsLARS, ])
-                invisible(sc)
-            }
-            # Treat target genes one by one
-            if (useparallel) {
-                score <- mclapply(seq(ngenes), stabselonegene, mc.cores=n_cores)
-            } else {
-                score <- lapply(seq(ngenes),stabselonegene)
-            }
-            # Rank scores
-            edgepred <- list()
-            for (i in seq(scorestokeep)) {
-                # Combine all scores in a single vectors
-                myscore <- unlist(lapply(score,function(x) x[,1,drop=FALSE]))
-                ranki <- order(myscore,decreasing=TRUE)[1:K]
-                edgepred[[i]] <- data.frame(list(tf=tflist[(ranki-1)%%ntf+1] , target=genenames[(ranki-1)%/%ntf+1] , score=myscore[ranki]))
-            }
-            return(edgepred)
-        }
-        ''')
-        tigress = globalenv['tigress']
-        interactions = ro.conversion.rpy2py(
-            tigress(
-                ro.conversion.py2rpy(data), self.tf_list, self.k, self.alpha,
-                self.n_steps_lars, self.n_bootstrap, self.scoring,
-                self.verbose, self.use_parallel, self.n_cores
-            )[0]
+        genes = data.columns
+        number_of_genes = len(genes)
+        tf_list = self._get_tf_list(genes)
+        number_of_tfs = len(tf_list)
+        # make sure there are no more steps than variables
+        n_steps_lars = min(self.n_steps_lars, number_of_tfs - 1)
+        if n_steps_lars < 1:
+            logger.error('too few transcription factors.')
+            raise RuntimeError('too few transcription factors.')
+        if n_steps_lars != self.n_steps_lars:
+            logger.debug('n_steps_lars changed to {}'.format(n_steps_lars))
+        # locate the transcription factors in the gene list
+        tf_indices = genes.get_indexer(tf_list)
+        if (tf_indices < 0).any():
+            logger.error('could not find all TFs in the gene list.')
+            raise RuntimeError('could not find all TFs in the gene list.')
+        # treat target genes in one batch per worker, seeding each target
+        # to make the results independent from the batching
+        n_jobs = self.n_cores if self.use_parallel else 1
+        x = data.values.astype(float)
+        seeds = np.random.randint(np.iinfo(np.int32).max, size=number_of_genes)
+        # NOTE: the workers already use all the cores, hence BLAS threads
+        # are limited to avoid oversubscription on the small LARS problems
+        with parallel_backend('loky', inner_max_num_threads=1):
+            scores = np.vstack(
+                Parallel(n_jobs=n_jobs, verbose=10 if self.verbose else 0)(
+                    delayed(stability_scores)(
+                        x, targets, tf_indices, seeds[targets],
+                        self.n_bootstrap, n_steps_lars, self.alpha,
+                        self.scoring
+                    )
+                    for targets in np.array_split(
+                        np.arange(number_of_genes), n_jobs
+                    )
+                    if len(targets)
+                )
+            ).ravel()
+        # rank the scores over all the transcription factor and target pairs
+        k = number_of_tfs * number_of_genes
+        if self.k != -1:
+            k = min(self.k, k)
+        ranking = np.argsort(-scores, kind='mergesort')[:k]
+        interactions = pd.DataFrame(
+            {
+                'e1': tf_list[ranking % number_of_tfs],
+                'e2': genes.values[ranking // number_of_tfs],
+                'intensity': scores[ranking]
+            },
+            columns=['e1', 'e2', 'intensity']
         )
-        interactions.columns = ['e1', 'e2', 'intensity']
         self.graph = InteractionTable(df=interactions).to_graph()
         logger.debug('inferred with {}'.format(self.method))
 
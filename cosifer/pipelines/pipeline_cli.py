@@ -1,15 +1,24 @@
 """COSIFER client pipeline."""
 import os
 import json
+import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from joblib import Parallel, delayed
 from ..inferencers import INFERENCERS, RECOMMENDED_INFERENCERS
 from ..combiners import COMBINERS, RECOMMENDED_COMBINER, COMBINER_TYPES
-from ..collections.interaction_table import interaction_table_from_gzip
+from ..collections.interaction_table import (
+    InteractionTable, interaction_table_from_gzip
+)
 from ..utils.data import read_data, read_gmt
+from ..utils.conversion import shared_r_conversion
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
+CACHE_DIRECTORY = '.cache'
+MAXIMUM_LOADING_THREADS = 8
+
 
 def method_selection(methods=None):
     """
@@ -34,7 +43,67 @@ def method_selection(methods=None):
     )
 
 
-def run_inference(data, selected_methods, output_directory):
+def run_single_inference(name, inferencer, data, output_directory):
+    """
+    Perform network inference of the data with a method and save the
+    predicted graph in an output directory.
+
+    Args:
+        name (str): name of the method.
+        inferencer (NetworkInferencer): the inferencer.
+        data (pd.DataFrame): input dataframe.
+        output_directory (str): output directory.
+
+    Returns:
+        InteractionTable: the interaction table as stored in the output
+            directory, None in case the inference failed or no interaction
+            was stored.
+    """
+    try:
+        output_filepath = os.path.join(
+            output_directory, '{}.csv.gz'.format(name)
+        )
+        # NOTE: inferences are cached in the output format, keyed by a
+        # fingerprint of the method, its hyperparameters and the data, hence
+        # results of previous runs are reused only when valid
+        cache_filepath = os.path.join(
+            output_directory, CACHE_DIRECTORY, '{}.{}.csv.gz'.format(
+                name, inferencer.get_fingerprint(data)
+            )
+        )
+        interaction_table = None
+        if os.path.isfile(cache_filepath):
+            logger.info(
+                'inference already run and stored in {}'.format(
+                    cache_filepath
+                )
+            )
+            interaction_table = interaction_table_from_gzip(cache_filepath)
+        else:
+            logger.info('start inference with method {}'.format(name))
+            inferencer.filepath = cache_filepath
+            inferencer.infer_network(data)
+            # NOTE: allow retraining on new data
+            inferencer.trained = False
+            if inferencer.graph.adjacency.size > 0:
+                # NOTE: same edges and labels as reading the stored table
+                interaction_table = InteractionTable(
+                    df=inferencer.graph.to_interaction_table().df[
+                        ['e1', 'e2', 'intensity']
+                    ]
+                )
+        if os.path.isfile(cache_filepath):
+            # the output file is the latest cached inference
+            shutil.copyfile(cache_filepath, output_filepath)
+        elif os.path.isfile(output_filepath):
+            # NOTE: avoid combining the output of a previous inference
+            os.remove(output_filepath)
+        return interaction_table
+    except Exception:
+        logger.exception('error with inferencer {}'.format(name))
+
+
+def run_inference(data, selected_methods, output_directory, n_jobs=1):
     """
     Perform network inference of the data given a set of methods
     and save the predicted graphs in an output directory.
@@ -43,46 +112,82 @@ def run_inference(data, selected_methods, output_directory):
         data (pd.DataFrame): input dataframe.
         selected_methods (dict): selected inference methods.
         output_directory (str): output directory.
-    """
+        n_jobs (int, optional): number of methods run in parallel processes.
+            Defaults to 1, a.k.a., methods run sequentially sharing the R
+            conversion of the data.
 
-    for name, inferencer in selected_methods.items():
-        try:
-            output_filepath = '{}/{}.csv.gz'.format(output_directory, name)
-            if not os.path.exists(output_filepath):
-                logger.info('start inference with method {}'.format(name))
-                inferencer.filepath = output_filepath
-                inferencer.load()
-                inferencer.infer_network(data)
-                # NOTE: allow retraining on new data
-                inferencer.trained = False
-            else:
-                logger.info(
-                    'inference already run and stored in {}'.
-                    format(output_filepath)
+    Returns:
+        dict: interaction tables stored by the selected methods, avoiding
+            to read them back from the output directory.
+    """
+    if n_jobs > 1 and len(selected_methods) > 1:
+        # NOTE: the methods are independent and store their results in
+        # different files, hence they can run in separate processes sharing
+        # a memory mapped copy of the data
+        interaction_tables = dict(
+            zip(
+                selected_methods,
+                Parallel(n_jobs=min(n_jobs, len(selected_methods)))(
+                    delayed(run_single_inference)(
+                        name, inferencer, data, output_directory
+                    ) for name, inferencer in selected_methods.items()
                 )
-        except Exception:
-            logger.exception('error with inferencer {}'.format(name))
+            )
+        )
+    else:
+        with shared_r_conversion():
+            interaction_tables = dict(
+                (
+                    name,
+                    run_single_inference(
+                        name, inferencer, data, output_directory
+                    )
+                ) for name, inferencer in selected_methods.items()
+            )
+    return dict(
+        (name, interaction_table)
+        for name, interaction_table in interaction_tables.items()
+        if interaction_table is not None
+    )
 
 
-def get_interaction_tables(output_directory):
+def get_interaction_tables(output_directory, excluded=None):
     """
     Transform graphs from the output directory into interaction tables.
 
     Args:
         output_directory (str): path to the output directory
+        excluded (iterable, optional): names of the methods whose graphs are
+            not loaded. Defaults to None, a.k.a., load all graphs.
 
     Returns:
         dict: interaction tables from each method in a dictionary.
     """
-    interaction_tables_dict = dict()
-    for filename in os.listdir(output_directory):
-        if filename.endswith('.csv.gz'):
-            method = filename.replace('.csv.gz', '')
-            filepath = os.path.join(output_directory, filename)
-            interaction_tables_dict[method] = interaction_table_from_gzip(
-                filepath
+    excluded = set(excluded) if excluded else set()
+    filenames = [
+        filename for filename in os.listdir(output_directory)
+        if filename.endswith('.csv.gz') and
+        filename.replace('.csv.gz', '') not in excluded
+    ]
+    if not filenames:
+        return dict()
+    # NOTE: decompression and parsing partly release the GIL, hence the
+    # tables are loaded in threads
+    with ThreadPoolExecutor(
+        max_workers=min(MAXIMUM_LOADING_THREADS, len(filenames))
+    ) as executor:
+        interaction_tables = executor.map(
+            interaction_table_from_gzip, [
+                os.path.join(output_directory, filename)
+                for filename in filenames
+            ]
+        )
+        return dict(
+            zip(
+                [filename.replace('.csv.gz', '') for filename in filenames],
+                interaction_tables
             )
-    return interaction_tables_dict
+        )
 
 
 def run_combiner(combiner_name, interaction_tables_dict, output_directory):
@@ -134,6 +239,7 @@ def run(
     methods=None,
     combiner=None,
     gmt_filepath=None,
+    n_jobs=1,
     **kwargs
 ):
     """
@@ -159,6 +265,8 @@ def run(
             no combination.
         gmt_filepath (str, optional): GMT file containing feature sets.
             Defaults to None, a.k.a., no GMT file provided.
+        n_jobs (int, optional): number of inference methods run in
+            parallel. Defaults to 1.
     """
     # ensure the output directory exists
     os.makedirs(output_directory, exist_ok=True)
@@ -196,14 +304,19 @@ def run(
         # select features discarding missing ones
         matching_features = list(set(data.columns) & feature_set)
         if len(matching_features) > 2:
-            # run the inference methods
-            run_inference(
+            # run the inference methods, getting the inferred tables
+            tables = run_inference(
                 data[matching_features], selected_methods,
-                results_output_directory
+                results_output_directory, n_jobs=n_jobs
             )
             if combiner is not None:
-                # get the inferred tables
-                tables = get_interaction_tables(results_output_directory)
+                # NOTE: networks stored by earlier runs with other methods
+                # are combined as well, the inferred ones are not read back
+                tables = dict(
+                    get_interaction_tables(
+                        results_output_directory, excluded=tables
+                    ), **tables
+                )
                 if len(tables) > 1:
                     # run the combination
                     run_combiner(combiner, tables, results_output_directory)
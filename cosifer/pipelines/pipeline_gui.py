@@ -3,8 +3,10 @@ import sys
 import os
 import logging
 from copy import deepcopy
+from joblib import Parallel, delayed
 from ..inferencers import INFERENCERS, RECOMMENDED_INFERENCERS
 from ..combiners import COMBINERS, RECOMMENDED_COMBINER
+from ..utils.conversion import shared_r_conversion
 
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -33,7 +35,30 @@ def method_selection(methods=None):
     )
 
 
-def run_inference(data, selected_methods):
+def run_single_inference(name, inferencer, data):
+    """
+    Perform network inference of the data with a method.
+
+    Args:
+        name (str): name of the method.
+        inferencer (NetworkInferencer): the inferencer.
+        data (pd.DataFrame): input dataframe.
+
+    Returns:
+        InteractionTable: the inferred interaction table, None in case the
+            inference failed.
+    """
+    logger.info('start inference with method {}'.format(name))
+    try:
+        inferencer.infer_network(data)
+        interaction_table = inferencer.graph.to_interaction_table()
+        logger.info('inference with {} was successful.'.format(name))
+        return interaction_table
+    except Exception:
+        logger.exception('inference with {} failed.'.format(name))
+
+
+def run_inference(data, selected_methods, n_jobs=1):
     """
     Perform network inference of the data given a set of methods
     and return the predicted graphs.
@@ -41,22 +66,36 @@ def run_inference(data, selected_methods):
     Args:
         data (pd.DataFrame): input dataframe.
         selected_methods (dict): selected inference methods.
+        n_jobs (int, optional): number of methods run in parallel processes.
+            Defaults to 1, a.k.a., methods run sequentially sharing the R
+            conversion of the data.
 
     Returns:
         dict: interaction tables inferred with the selected methods.
     """
-    interaction_tables_dict = dict()
-    for name, inferencer in selected_methods.items():
-        logger.info('start inference with method {}'.format(name))
-        try:
-            inferencer.infer_network(data)
-            interaction_tables_dict[name] = (
-                inferencer.graph.to_interaction_table()
+    if n_jobs > 1 and len(selected_methods) > 1:
+        # NOTE: the methods are independent, hence they can run in
+        # separate processes sharing a memory mapped copy of the data
+        interaction_tables = dict(
+            zip(
+                selected_methods,
+                Parallel(n_jobs=min(n_jobs, len(selected_methods)))(
+                    delayed(run_single_inference)(name, inferencer, data)
+                    for name, inferencer in selected_methods.items()
+                )
+            )
+        )
+    else:
+        with shared_r_conversion():
+            interaction_tables = dict(
+                (name, run_single_inference(name, inferencer, data))
+                for name, inferencer in selected_methods.items()
             )
-            logger.info('inference with {} was successful.'.format(name))
-        except Exception:
-            logger.exception('inference with {} failed.'.format(name))
-    return interaction_tables_dict
+    return dict(
+        (name, interaction_table)
+        for name, interaction_table in interaction_tables.items()
+        if interaction_table is not None
+    )
 
 
 def run_combiner(combiner_name, interaction_tables_dict, results_filepath):
@@ -85,7 +124,7 @@ def run_combiner(combiner_name, interaction_tables_dict, results_filepath):
         logger.exception('error with combiner {}'.format(combiner_name))
 
 
-def run(data, results_filepath, methods=None, combiner='summa'):
+def run(data, results_filepath, methods=None, combiner='summa', n_jobs=1):
     """
     Run COSIFER GUI pipeline.
 
@@ -95,6 +134,8 @@ def run(data, results_filepath, methods=None, combiner='summa'):
         methods (list, optional): inference methods. Defaults to None, a.k.a.,
             only recommended methods.
         combiner (str, optional): combiner type. Defaults to summa.
+        n_jobs (int, optional): number of inference methods run in
+            parallel. Defaults to 1.
     """
     # make sure the output exists
     os.makedirs(os.path.dirname(results_filepath), exist_ok=True)
@@ -106,7 +147,9 @@ def run(data, results_filepath, methods=None, combiner='summa'):
         raise RuntimeError('No valid methods passed!')
 
     # run inference methods
-    interaction_tables_dict = run_inference(data, selected_methods)
+    interaction_tables_dict = run_inference(
+        data, selected_methods, n_jobs=n_jobs
+    )
     number_of_inferred_networks = len(interaction_tables_dict)
 
     if number_of_inferred_networks < 2:
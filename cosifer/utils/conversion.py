@@ -0,0 +1,92 @@
+"""R conversion and package loading utils."""
+from contextlib import contextmanager
+from functools import lru_cache
+import numpy as np
+from rpy2.rinterface import (
+    baseenv as baseenv_ri, FloatSexpVector, IntSexpVector, StrSexpVector
+)
+from rpy2.robjects.packages import importr
+
+r_matrix = baseenv_ri['matrix']
+r_list = baseenv_ri['list']
+as_data_frame = baseenv_ri['as.data.frame']
+
+# NOTE: conversions shared within shared_r_conversion, keyed by object id
+_shared_conversions = None
+
+
+def data_frame_to_r_matrix(df):
+    """
+    Convert a numeric dataframe to an R matrix, copying the values in a
+    single column-major buffer instead of converting column by column.
+
+    Args:
+        df (pd.DataFrame): a numeric dataframe.
+
+    Returns:
+        rpy2.rinterface.Sexp: an R numeric matrix with index and columns of
+            the dataframe as dimension names.
+    """
+    number_of_rows, number_of_columns = df.shape
+    return r_matrix(
+        FloatSexpVector(np.asarray(df.values, dtype=float).ravel(order='F')),
+        nrow=IntSexpVector([number_of_rows]),
+        ncol=IntSexpVector([number_of_columns]),
+        dimnames=r_list(
+            StrSexpVector(list(map(str, df.index))),
+            StrSexpVector(list(map(str, df.columns)))
+        )
+    )
+
+
+def data_frame_to_r_data_frame(df):
+    """
+    Convert a numeric dataframe to an R data.frame via an R matrix.
+    Within shared_r_conversion, the conversion of a dataframe is computed
+    once and reused.
+
+    Args:
+        df (pd.DataFrame): a numeric dataframe.
+
+    Returns:
+        rpy2.rinterface.Sexp: an R data.frame.
+    """
+    if _shared_conversions is None:
+        return as_data_frame(data_frame_to_r_matrix(df))
+    key = id(df)
+    if key not in _shared_conversions:
+        # NOTE: keeping a reference to the dataframe guarantees the id is
+        # not reused within the context
+        _shared_conversions[key] = (
+            df, as_data_frame(data_frame_to_r_matrix(df))
+        )
+    return _shared_conversions[key][1]
+
+
+@contextmanager
+def shared_r_conversion():
+    """
+    Context where R conversions of the same dataframe are shared, e.g.,
+    across inferencers running on the same data. Dataframes should not be
+    modified within the context.
+    """
+    global _shared_conversions
+    _shared_conversions = {}
+    try:
+        yield
+    finally:
+        _shared_conversions = None
+
+
+@lru_cache(maxsize=None)
+def get_r_package(name):
+    """
+    Get an R package, importing it only on the first call.
+
+    Args:
+        name (str): name of the R package.
+
+    Returns:
+        rpy2.robjects.packages.Package: the imported package.
+    """
+    return importr(name)
@@ -1,14 +1,38 @@
 """Data utilities."""
 import logging
-import re
+import warnings
 import numpy as np
 import pandas as pd
-from numpy.linalg import linalg
+from scipy.linalg import cholesky, solve_triangular
 from sklearn.datasets import make_sparse_spd_matrix
 
 logger = logging.getLogger(__name__.split('.')[-1])
 
-MORE_THAN_ONE_WHITESPACE_REGEX = re.compile(r'\s+')
+READ_DATA_PARAMETERS = {'engine': 'c', 'low_memory': False}
+
+
+def standardize_data(data):
+    """
+    Standardize the columns of a dataframe ignoring NAs, operating in place
+    on a single copy of the values.
+
+    Args:
+        data (pd.DataFrame): a numeric dataframe.
+
+    Returns:
+        pd.DataFrame: the standardized dataframe. Constant columns are set
+            to NaN as for a division by a null standard deviation.
+    """
+    values = np.array(data.values, dtype=float)
+    with warnings.catch_warnings():
+        # NOTE: all-NaN columns have undefined statistics
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values -= mean
+        values /= std
+    return pd.DataFrame(values, index=data.index, columns=data.columns)
 
 
 def read_data(
@@ -36,11 +60,15 @@ def read_data(
         pd.DataFrame: a dataframe parsed from the provided filepath.
     """
     _ = kwargs.pop('sep', None)
-    data = pd.read_table(filepath, sep=sep, **kwargs)
+    # NOTE: parse with the C engine inferring the types on whole columns
+    # instead of chunks, unless differently specified
+    parsing_parameters = dict(READ_DATA_PARAMETERS)
+    parsing_parameters.update(kwargs)
+    data = pd.read_csv(filepath, sep=sep, **parsing_parameters)
     if not samples_on_rows:
         data = data.T
     if standardize:
-        data = (data - data.mean()) / data.std()
+        data = standardize_data(data)
     data = data.dropna(how='all', axis=1)
     if fillna is not None:
         data = data.fillna(fillna)
@@ -77,20 +105,27 @@ def get_synthetic_data(
         )
     else:
         prec = precision_matrix
-    cov = linalg.inv(prec)
-    d = np.sqrt(np.diag(cov))
-    cov /= d
-    cov /= d[:, np.newaxis]
+    # NOTE: with prec = L L^T the covariance is L^-T L^-1, hence samples are
+    # obtained from the inverse of the Cholesky factor without inverting
+    # and decomposing the covariance
+    inverse_cholesky = solve_triangular(
+        cholesky(prec, lower=True), np.eye(n_features), lower=True
+    )
+    # scale the precision consistently with a unit diagonal covariance
+    d = np.sqrt(np.einsum('ij,ij->j', inverse_cholesky, inverse_cholesky))
     prec *= d
     prec *= d[:, np.newaxis]
-    X = prng.multivariate_normal(np.zeros(n_features), cov, size=n_samples)
+    # NOTE: the standardization below makes the samples independent from
+    # the covariance scaling
+    X = prng.standard_normal((n_samples, n_features)).dot(inverse_cholesky)
     X -= X.mean(axis=0)
     X /= X.std(axis=0)
 
-    X = pd.DataFrame(X)
-
-    X.columns = ["gene" + str(i) for i in X.columns]
-    X.index = ["sample" + str(i) for i in X.index]
+    X = pd.DataFrame(
+        X,
+        index=np.char.add('sample', np.arange(n_samples).astype(str)),
+        columns=np.char.add('gene', np.arange(n_features).astype(str))
+    )
 
     return X, prec
 
@@ -107,12 +142,14 @@ def scale_graph(graph, threshold=.0):
     Returns:
         pd.DataFrame: a dataframe representing the scaled graph.
     """
-    scaled_graph = np.abs(graph)
-    max_value = max(scaled_graph.values.flatten())
-    scaled_graph /= max_value
-    np.fill_diagonal(scaled_graph.values, .0)
+    # scaling in place on a single new buffer
+    scaled_graph = np.abs(graph.values, dtype=float)
+    scaled_graph /= scaled_graph.max()
+    np.fill_diagonal(scaled_graph, .0)
     scaled_graph[scaled_graph < threshold] = .0
-    return scaled_graph
+    return pd.DataFrame(
+        scaled_graph, index=graph.index, columns=graph.columns
+    )
 
 
 def read_gmt(filepath):
@@ -126,10 +163,11 @@ def read_gmt(filepath):
         dict: a dictionary containing sets of features.
     """
     sets = dict()
-    with open(filepath, 'rb') as fp:
+    with open(filepath, encoding='utf-8') as fp:
         for line in fp:
-            splitted = MORE_THAN_ONE_WHITESPACE_REGEX.split(
-                line.strip().decode()
-            )
-            sets[splitted[0]] = set(splitted[2:])
+            # NOTE: splitting on runs of whitespace ignoring leading and
+            # trailing ones
+            splitted = line.split()
+            if splitted:
+                sets[splitted[0]] = set(splitted[2:])
     return sets
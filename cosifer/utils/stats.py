@@ -1,15 +1,97 @@
 """Statistics utils."""
 import numpy as np
 import pandas as pd
-from statsmodels.stats import multitest as mt
 from .data import scale_graph
 
 
+def correction_significance(
+    p_values, q_star, correction, sorted_p_values, number_of_tests=None
+):
+    """
+    Return the significance of p-values that make reject null hypothesis
+    at given significance level with a multiple testing correction.
+    Only the rejections are computed, following the statsmodels
+    multipletests implementation.
+
+    Args:
+        p_values (np.ndarray): p-values to be used for correction.
+        q_star (float): false discovery rate.
+        correction (str): correction, one of 'bonferroni', 'b-h' or 'b-y'.
+        sorted_p_values (np.ndarray): the sorted p-values.
+        number_of_tests (int, optional): total number of tests, the ones
+            without a p-value are accounted for as p-values equal to one,
+            never rejected for a q_star below one. Defaults to None, a.k.a.,
+            the number of p-values.
+
+    Returns:
+        np.ndarray: boolean array indicating the significant p-values.
+    """
+    if number_of_tests is None:
+        number_of_tests = len(p_values)
+    if correction == 'bonferroni':
+        return p_values <= q_star / float(number_of_tests)
+    # NOTE: the missing p-values equal to one are the last in order, hence
+    # the given p-values keep their ranks
+    factors = np.arange(1, len(p_values) + 1) / float(number_of_tests)
+    if correction == 'b-y':
+        factors /= np.sum(1. / np.arange(1, number_of_tests + 1))
+    below = np.flatnonzero(sorted_p_values <= factors * q_star)
+    # NOTE: all the p-values up to the largest one below its threshold are
+    # significant, ties included
+    return (
+        p_values <= sorted_p_values[below[-1]]
+        if below.size else np.zeros(len(p_values), dtype=bool)
+    )
+
+
+def multiple_testing_significance(
+    p_values, q_star, corrections=('bonferroni', 'b-h', 'b-y'),
+    number_of_tests=None
+):
+    """
+    Return the significance of p-values for several multiple testing
+    corrections, sorting the p-values once. NaN p-values are never
+    significant.
+
+    Args:
+        p_values (iterable): p-values to be used for correction.
+        q_star (float): false discovery rate.
+        corrections (iterable, optional): corrections to apply. Defaults to
+            ('bonferroni', 'b-h', 'b-y').
+        number_of_tests (int, optional): total number of tests, the ones
+            without a p-value are accounted for as p-values equal to one.
+            Defaults to None, a.k.a., the number of p-values.
+
+    Returns:
+        dict: boolean arrays indicating the significant p-values keyed by
+            correction.
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    if not len(p_values):
+        return dict(
+            (correction, np.zeros(0, dtype=bool))
+            for correction in corrections
+        )
+    # NOTE: Bonferroni does not need sorting
+    sorted_p_values = (
+        np.sort(p_values)
+        if set(corrections) - {'bonferroni'} else None
+    )
+    return dict(
+        (
+            correction,
+            correction_significance(
+                p_values, q_star, correction, sorted_p_values,
+                number_of_tests=number_of_tests
+            )
+        ) for correction in corrections
+    )
+
+
 def bonferroni_correction(p_values, q_star):
     """
     Return indices of pValues that make reject null hypothesis
     at given significance level with a Bonferroni correction.
-    Used implementation robust to nan values through statsmodels.
 
     Args:
         p_values (iterable): p-values to be used for correction.
@@ -18,18 +100,15 @@ def bonferroni_correction(p_values, q_star):
     Returns:
         list: indices of significant p-values.
     """
-    return [
-        idx for idx, significant in
-        enumerate(mt.multipletests(p_values, alpha=q_star, method='b')[0])
-        if significant
-    ]
+    return np.flatnonzero(
+        CORRECTIONS_SIGNIFICANCE['bonferroni'](p_values, q_star)
+    ).tolist()
 
 
 def benjamini_hochberg_correction(p_values, q_star):
     """
     Return indices of pValues that make reject null hypothesis
     at given significance level with a Benjamini-Hochberg correction.
-    Used implementation robust to nan values through statsmodels.
 
     Args:
         p_values (iterable): p-values to be used for correction.
@@ -38,18 +117,15 @@ def benjamini_hochberg_correction(p_values, q_star):
     Returns:
         list: indices of significant p-values.
     """
-    return [
-        idx for idx, significant in enumerate(
-            mt.multipletests(p_values, alpha=q_star, method='fdr_bh')[0]
-        ) if significant
-    ]
+    return np.flatnonzero(
+        CORRECTIONS_SIGNIFICANCE['b-h'](p_values, q_star)
+    ).tolist()
 
 
 def benjamini_yekutieli_correction(p_values, q_star):
     """
     Return indices of pValues that make reject null hypothesis
     at given significance level with a Benjamini-Yekutieli correction.
-    Used implementation robust to nan values through statsmodels.
 
     Args:
         p_values (iterable): p-values to be used for correction.
@@ -58,11 +134,9 @@ def benjamini_yekutieli_correction(p_values, q_star):
     Returns:
         list: indices of significant p-values.
     """
-    return [
-        idx for idx, significant in enumerate(
-            mt.multipletests(p_values, alpha=q_star, method='fdr_by')[0]
-        ) if significant
-    ]
+    return np.flatnonzero(
+        CORRECTIONS_SIGNIFICANCE['b-y'](p_values, q_star)
+    ).tolist()
 
 
 CORRECTIONS = {
@@ -72,9 +146,17 @@ CORRECTIONS = {
 }
 
 CORRECTIONS_SIGNIFICANCE = {
-    'bonferroni': lambda p, t: mt.multipletests(p, alpha=t, method='b')[0],
-    'b-h': lambda p, t: mt.multipletests(p, alpha=t, method='fdr_bh')[0],
-    'b-y': lambda p, t: mt.multipletests(p, alpha=t, method='fdr_by')[0]
+    'bonferroni': lambda p, t, number_of_tests=None: (
+        multiple_testing_significance(
+            p, t, ['bonferroni'], number_of_tests=number_of_tests
+        )['bonferroni']
+    ),
+    'b-h': lambda p, t, number_of_tests=None: multiple_testing_significance(
+        p, t, ['b-h'], number_of_tests=number_of_tests
+    )['b-h'],
+    'b-y': lambda p, t, number_of_tests=None: multiple_testing_significance(
+        p, t, ['b-y'], number_of_tests=number_of_tests
+    )['b-y']
 }
 
 
@@ -90,9 +172,13 @@ def from_precision_matrix_partial_correlations(precision, scaled=False):
     Returns:
         np.ndarray: the partial correlation matrix.
     """
-    diag = np.diag(precision)
-    cross_diagonal_sqrt = np.sqrt(np.outer(diag, diag))
-    partial_correlations = -precision / cross_diagonal_sqrt
+    # NOTE: scaling rows and columns by broadcasting, without materializing
+    # the outer product of the diagonal
+    sqrt_diagonal = np.sqrt(np.diag(precision))
+    partial_correlations = np.divide(
+        precision, sqrt_diagonal[:, np.newaxis]
+    )
+    partial_correlations /= -sqrt_diagonal
     np.fill_diagonal(partial_correlations, 1.)
     return (
         scale_graph(pd.DataFrame(partial_correlations)).values
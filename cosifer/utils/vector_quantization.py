@@ -1,7 +1,11 @@
 """Vector quantization utilities."""
+import logging
 import numpy as np
+from joblib import Parallel, delayed, parallel_backend
 from sklearn.cluster import KMeans
 
+logger = logging.getLogger(__name__.split('.')[-1])
+
 
 def k_means_bic(X, clusters_centers, clusters_labels, sigma_eps=1.):
     """
@@ -18,18 +22,29 @@ def k_means_bic(X, clusters_centers, clusters_labels, sigma_eps=1.):
     """
     n, m = X.shape
     k, _ = clusters_centers.shape
-    points = range(n)
-    likelihood = (
-        (
-            (X[points, :] - clusters_centers[clusters_labels[points], :]) /
-            sigma_eps
-        )**2
-    ).sum()
+    residuals = X - clusters_centers[clusters_labels]
+    # NOTE: squared norm of the residuals reduced in a single pass
+    likelihood = np.einsum('ij,ij->', residuals, residuals) / sigma_eps**2
     return likelihood + m * k * np.log(n)
 
 
+def fit_k_means(X, k, **kwargs):
+    """
+    Fit a K-means model.
+
+    Args:
+        X (np.ndarray): data to cluster.
+        k (int): number of clusters.
+
+    Returns:
+        sklearn.cluster.KMeans: the fitted model.
+    """
+    return KMeans(init='k-means++', n_clusters=k, **kwargs).fit(X)
+
+
 def k_means_optimized_with_bic(
-    X, k_min=3, k_max=9, k_step=1, sigma_eps=1., n_init=100, **kwargs
+    X, k_min=3, k_max=9, k_step=1, sigma_eps=1., n_init=10, n_jobs=1,
+    **kwargs
 ):
     """
     Find an optimal K-mean model minizing the BIC score.
@@ -41,34 +56,121 @@ def k_means_optimized_with_bic(
         k_step (int, optional): number of cluster steps. Defaults to 1.
         sigma_eps (float, optional): standard deviation. Defaults to 1..
         n_init (int, optional): number of K-means initializations.
-            Defaults to 100.
+            Defaults to 10.
+        n_jobs (int, optional): number of processes fitting the models for
+            the different numbers of clusters. Defaults to 1.
 
     Returns:
         tuple: a tuple containing two elements: the first is the optimal model,
             the second one is a dictionary mapping the number of clusters to
             the BIC score.
     """
-    if k_min >= k_max:
+    # NOTE: only inverted ranges are widened, equal bounds require one fit
+    if k_min > k_max:
         k_max = k_min + k_step
 
     bic_dict = {}
     model_dict = {}
-
-    for k in range(k_min, k_max + 1, k_step):
-        model_dict[k] = KMeans(init='k-means++', n_clusters=k, **kwargs)
-        model_dict[k].fit(X)
-        bic_dict[k] = k_means_bic(
-            X,
-            model_dict[k].cluster_centers_,
-            model_dict[k].labels_,
-            sigma_eps=sigma_eps
+    n, m = X.shape
+    log_n = np.log(n)
+
+    ks = range(k_min, k_max + 1, k_step)
+    # NOTE: the fits are independent, hence they run in parallel limiting
+    # the threads of each worker to avoid oversubscription
+    with parallel_backend('loky', inner_max_num_threads=1):
+        models = Parallel(n_jobs=n_jobs)(
+            delayed(fit_k_means)(X, k, n_init=n_init, **kwargs) for k in ks
         )
+    for k, model in zip(ks, models):
+        model_dict[k] = model
+        # NOTE: the inertia is the squared norm of the residuals, hence
+        # the BIC as in k_means_bic without another pass over the data
+        bic_dict[k] = model_dict[k].inertia_ / sigma_eps**2 + m * k * log_n
     min_key = min(bic_dict, key=bic_dict.get)
     return model_dict[min_key], bic_dict
 
 
+def k_means_1d_dynamic_programming(values, weights, k_max):
+    """
+    Exact K-means on one dimensional data via dynamic programming, in the
+    spirit of Ckmeans.1d.dp by Haizhou Wang and Mingzhou Song.
+
+    Args:
+        values (np.ndarray): sorted unique values.
+        weights (np.ndarray): number of occurrences of the values.
+        k_max (int): maximum number of clusters.
+
+    Returns:
+        tuple: a tuple containing two elements: the first is the optimal
+            within-cluster sum of squares for 1 to k_max clusters (rows)
+            and the values up to each index (columns), the second one is
+            the index of the first value of the last cluster of the
+            corresponding optimal solutions.
+    """
+    u = len(values)
+    # NOTE: centering reduces cancellation in the sums of squares
+    values = values - np.average(values, weights=weights)
+    cumulative_weights = np.concatenate([[0.], np.cumsum(weights)])
+    cumulative_sums = np.concatenate([[0.], np.cumsum(weights * values)])
+    cumulative_squares = np.concatenate(
+        [[0.], np.cumsum(weights * values**2)]
+    )
+
+    def segment_costs(starts, stops):
+        """Sum of squares of the values from starts to stops excluded."""
+        sums = cumulative_sums[stops] - cumulative_sums[starts]
+        counts = cumulative_weights[stops] - cumulative_weights[starts]
+        return (
+            cumulative_squares[stops] - cumulative_squares[starts] -
+            sums * sums / counts
+        )
+
+    costs = np.full((k_max, u), np.inf)
+    first_indices = np.zeros((k_max, u), dtype=int)
+    costs[0] = segment_costs(0, np.arange(1, u + 1))
+    for level in range(1, min(k_max, u)):
+        previous_costs = costs[level - 1]
+        # NOTE: the optimal first index of the last cluster is monotone in
+        # the last index, hence ranges of last indices are bisected with
+        # the ranges of candidate first indices, all at once per depth
+        lows, highs = np.array([level]), np.array([u - 1])
+        first_lows, first_highs = lows, highs
+        while len(lows):
+            middles = (lows + highs) // 2
+            counts = np.minimum(first_highs, middles) - first_lows + 1
+            offsets = np.cumsum(counts) - counts
+            segments = np.repeat(np.arange(len(middles)), counts)
+            starts = np.arange(counts.sum()) - offsets[segments]
+            starts += first_lows[segments]
+            candidates = previous_costs[starts - 1] + segment_costs(
+                starts, middles[segments] + 1
+            )
+            minima = np.minimum.reduceat(candidates, offsets)
+            # first minimizer of each segment
+            minimizers = np.flatnonzero(candidates == minima[segments])
+            minimizers = minimizers[
+                np.flatnonzero(
+                    np.diff(np.concatenate([[-1], segments[minimizers]]))
+                )
+            ]
+            best = starts[minimizers]
+            costs[level, middles] = minima
+            first_indices[level, middles] = best
+            left = middles > lows
+            right = middles < highs
+            lows, highs, first_lows, first_highs = (
+                np.concatenate([lows[left], middles[right] + 1]),
+                np.concatenate([middles[left] - 1, highs[right]]),
+                np.concatenate([first_lows[left], best[right]]),
+                np.concatenate([best[left], first_highs[right]])
+            )
+    # NOTE: rounding can turn null sums of squares slightly negative
+    return np.maximum(costs, 0.), first_indices
+
+
 def k_means_vector_quantization(
-    x, k_min=3, k_max=9, k_step=1, sigma_eps=1., n_init=100, **kwargs
+    x, k_min=3, k_max=9, k_step=1, sigma_eps=1.,
+    method='dynamic_programming', **kwargs
 ):
     """
     Quantize a vector using K-means optimized via BIC score.
@@ -79,28 +181,73 @@ def k_means_vector_quantization(
         k_max (int, optional): maximum number of clusters. Defaults to 9.
         k_step (int, optional): number of cluster steps. Defaults to 1.
         sigma_eps (float, optional): standard deviation. Defaults to 1..
-        n_init (int, optional): number of K-means initializations.
-            Defaults to 100.
+        method (str, optional): clustering method, either
+            'dynamic_programming' or 'k_means'. Defaults to
+            'dynamic_programming', a.k.a., the one dimensional K-means is
+            solved exactly, while 'k_means' fits the K-means models with
+            k_means_optimized_with_bic.
+        kwargs (dict): additional parameters for k_means_optimized_with_bic,
+            ignored with a warning by the dynamic programming.
 
     Returns:
-        np.ndarray: the quantized vector.
+        np.ndarray: the quantized vector, with clusters numbered in the
+            order of their centers.
+
+    Raises:
+        RuntimeError: in case the clustering method is not supported.
     """
     assert x.shape[1] == 1
-    if k_min >= k_max:
+    # NOTE: only inverted ranges are widened, equal bounds require one fit
+    if k_min > k_max:
         k_max = k_min + k_step
 
-    model, _ = k_means_optimized_with_bic(
-        x,
-        k_min=k_min,
-        k_max=k_max,
-        k_step=k_step,
-        sigma_eps=sigma_eps,
-        **kwargs
-    )
-
-    sorted_centers_indices = np.argsort(np.ravel(model.cluster_centers_))
-    remapping = np.zeros(len(sorted_centers_indices), dtype=int)
-    for idx, cluster_idx in enumerate(sorted_centers_indices):
-        remapping[cluster_idx] = idx
+    if method == 'k_means':
+        model, _ = k_means_optimized_with_bic(
+            x,
+            k_min=k_min,
+            k_max=k_max,
+            k_step=k_step,
+            sigma_eps=sigma_eps,
+            **kwargs
+        )
+        sorted_centers_indices = np.argsort(np.ravel(model.cluster_centers_))
+        remapping = np.empty(len(sorted_centers_indices), dtype=int)
+        remapping[sorted_centers_indices] = np.arange(
+            len(sorted_centers_indices)
+        )
+        return remapping[model.labels_]
+    elif method != 'dynamic_programming':
+        logger.error(
+            'vector quantization method {} not supported.'.format(method)
+        )
+        raise RuntimeError(
+            'vector quantization method {} not supported.'.format(method)
+        )
+    if kwargs:
+        logger.warning(
+            'K-means parameters {} ignored by the dynamic programming, '
+            'use the k_means method to apply them.'.format(sorted(kwargs))
+        )
 
-    return remapping[model.labels_]
+    values, inverse, weights = np.unique(
+        np.ravel(x), return_inverse=True, return_counts=True
+    )
+    # NOTE: no more clusters than distinct values
+    ks = [k for k in range(k_min, k_max + 1, k_step) if k <= len(values)]
+    if not ks:
+        ks = [len(values)]
+    costs, first_indices = k_means_1d_dynamic_programming(
+        values, weights, max(ks)
+    )
+    # BIC as in k_means_bic, for a single feature
+    log_n = np.log(len(inverse))
+    k = min(ks, key=lambda k: costs[k - 1, -1] / sigma_eps**2 + k * log_n)
+    # backtrack the first value of each cluster
+    cluster_starts = np.zeros(k, dtype=int)
+    stop = len(values)
+    for level in range(k - 1, 0, -1):
+        cluster_starts[level] = first_indices[level, stop - 1]
+        stop = cluster_starts[level]
+    labels = np.zeros(len(values), dtype=int)
+    labels[cluster_starts[1:]] = 1
+    return np.cumsum(labels)[inverse]
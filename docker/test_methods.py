@@ -3,11 +3,10 @@
 """Run gui pipeline with all inferencers for each combiner."""
 import os
 import pandas as pd
+from joblib import Parallel, delayed
 from cosifer.combiners import COMBINERS
 from cosifer.inferencers import INFERENCERS
-from cosifer.pipelines.pipeline_cli import (
-    run_inference, get_interaction_tables, run_combiner
-)
+from cosifer.pipelines.pipeline_cli import run_inference, run_combiner
 
 # depends on docker mount
 df = pd.read_csv('/data/demo/data_matrix.csv')
@@ -16,10 +15,13 @@ df.head()
 output_directory = '/tmp/test/'
 os.makedirs(output_directory, exist_ok=False)
 
-run_inference(df, INFERENCERS, output_directory)
-tables = get_interaction_tables(output_directory)
-for combiner_name in COMBINERS.keys():
-    run_combiner(combiner_name, tables, output_directory)
+# NOTE: the stored tables are returned, no need to read them back
+tables = run_inference(df, INFERENCERS, output_directory)
+# NOTE: combiners are independent and write different files
+Parallel(n_jobs=-1)(
+    delayed(run_combiner)(combiner_name, tables, output_directory)
+    for combiner_name in COMBINERS.keys()
+)
 
 expected_number_of_networks = len(INFERENCERS) + len(COMBINERS)
 _, _, files = next(os.walk(output_directory))
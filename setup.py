@@ -2,9 +2,6 @@
 import os
 import subprocess
 from setuptools import setup, find_packages, Command
-from setuptools.command.bdist_egg import bdist_egg as _bdist_egg
-from setuptools.command.develop import develop as _develop
-from distutils.command.build import build as _build
 
 SETUP_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -38,36 +35,6 @@ class setup_cosifer(Command):
             )
 
 
-class build(_build):
-    """Build command."""
-
-    sub_commands = [
-        ('setup_cosifer', None)
-    ] + _build.sub_commands
-
-
-class bdist_egg(_bdist_egg):
-    """Build bdist_egg."""
-
-    def run(self):
-        """Run build bdist_egg."""
-        self.run_command('setup_cosifer')
-        _bdist_egg.run(self)
-
-
-class develop(_develop):
-    """Build develop."""
-
-    def run(self):
-        """Run build develop."""
-        setup_cosifer = self.distribution.get_command_obj(
-            'setup_cosifer'
-        )
-        setup_cosifer.develop = True
-        self.run_command('setup_cosifer')
-        _develop.run(self)
-
-
 scripts = ['bin/cosifer', 'bin/cosifer-combine']
 
 setup(
@@ -79,22 +46,20 @@ setup(
     author='Matteo Manica, Joris Cadow',
     author_email='drugilsberg@gmail.com, joriscadow@gmail.com',
     packages=find_packages('.'),
-    cmdclass={
-        'bdist_egg': bdist_egg,
-        'build': build,
-        'setup_cosifer': setup_cosifer,
-        'develop': develop
-    },
+    # NOTE: R dependencies are installed on demand and not on every build
+    cmdclass={'setup_cosifer': setup_cosifer},
     install_requires=[
         'numpy',
         'scipy',
         'seaborn',
         'pandas<1.0',
         'scikit-learn',
-        'statsmodels',
+        'joblib>=0.14',
         'rpy2',
         'pySUMMA @ git+https://github.com/learn-ensemble/PY-SUMMA'
     ],
+    # NOTE: graphs stored as parquet files
+    extras_require={'parquet': ['pyarrow']},
     zip_safe=False,
     scripts=scripts
 )
@@ -9,7 +9,6 @@ Rscript -e 'if (!require("BiocManager")) {install.packages("BiocManager", repos=
 Rscript -e 'if (!require("JRF")) {install.packages("JRF", repos="https://cran.rstudio.com");}'
 Rscript -e 'if (!require("FunChisq")) {install.packages("FunChisq", repos="https://cran.rstudio.com");}'
 Rscript -e 'if (!require("GENIE3")) {BiocManager::install("GENIE3");}'
-Rscript -e 'if (!require("lars")) {install.packages("lars", repos="https://cran.rstudio.com");}'
 Rscript -e 'if (!require("reshape2")) {install.packages("reshape2", repos="https://cran.rstudio.com");}'
 Rscript -e 'if (!require("doParallel")) {install.packages("doParallel", repos="https://cran.rstudio.com");}'
 Rscript -e 'if (!require("doRNG")) {install.packages("doRNG", repos="https://cran.rstudio.com");}'